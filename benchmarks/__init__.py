@@ -0,0 +1,6 @@
+"""
+Benchmarks Package
+
+End-to-end benchmarks for the GitHub Event Monitor, driven by a synthetic
+event generator and a local stub of the GitHub Events API.
+"""
@@ -0,0 +1,382 @@
+"""
+Synthetic Event Generator
+
+This module generates synthetic GitHub events whose shape matches the raw
+payloads returned by the GitHub Events API (see the samples in data/bronze).
+"""
+import random
+import string
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+# Relative frequency of event types, taken from the bronze samples
+EVENT_TYPE_WEIGHTS = {
+    "PushEvent": 14912,
+    "CreateEvent": 2073,
+    "PullRequestEvent": 1060,
+    "WatchEvent": 666,
+    "IssueCommentEvent": 483,
+    "DeleteEvent": 426,
+    "IssuesEvent": 307,
+    "PullRequestReviewEvent": 255,
+    "PullRequestReviewCommentEvent": 179,
+    "ForkEvent": 130,
+    "ReleaseEvent": 86,
+    "PublicEvent": 72,
+    "MemberEvent": 32,
+    "GollumEvent": 21,
+    "CommitCommentEvent": 19,
+}
+
+API_ROOT = "https://api.github.com"
+FIRST_EVENT_ID = 49593660360
+
+
+class SyntheticEventGenerator:
+    """
+    Generates raw GitHub events with realistic type mix, payload shapes
+    and repository/actor popularity skew.
+
+    Repository and actor names are drawn from fixed pools so that every
+    name maps to a single stable id, as it does on GitHub.
+    """
+
+    def __init__(
+        self,
+        seed: int = 42,
+        repo_count: int = 50_000,
+        actor_count: int = 100_000,
+        body_size: int = 2_000,
+        event_types: Optional[List[str]] = None,
+    ):
+        self.random = random.Random(seed)
+        self.body_size = body_size
+        self.repos = [self._make_repo(i) for i in range(repo_count)]
+        self.actors = [self._make_actor(i) for i in range(actor_count)]
+        self.types = event_types or list(EVENT_TYPE_WEIGHTS)
+        self.type_weights = [EVENT_TYPE_WEIGHTS.get(t, 1) for t in self.types]
+        # Pareto-like skew: a few repositories and actors produce most events
+        self.repo_weights = [1 / (i + 1) for i in range(repo_count)]
+        self.actor_weights = [1 / (i + 1) ** 0.5 for i in range(actor_count)]
+        self.next_id = FIRST_EVENT_ID
+        self._filler = "".join(
+            self.random.choices(string.ascii_letters + " ", k=max(body_size, 1))
+        )
+
+    def generate(
+        self,
+        count: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate a list of events ordered oldest first.
+
+        Args:
+            count: Number of events to generate
+            start: Timestamp of the first event (default: `end` minus 24 hours)
+            end: Timestamp of the last event (default: now)
+
+        Returns:
+            List of raw event dictionaries
+        """
+        return list(self.iter_events(count, start, end))
+
+    def iter_events(
+        self,
+        count: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily yield `count` events spread evenly between `start` and `end`."""
+        end = end or datetime.now(timezone.utc)
+        start = start or end - timedelta(hours=24)
+        step = (end - start) / max(count - 1, 1)
+        repos = self.random.choices(self.repos, self.repo_weights, k=count)
+        actors = self.random.choices(self.actors, self.actor_weights, k=count)
+        types = self.random.choices(self.types, self.type_weights, k=count)
+        for i in range(count):
+            yield self.make_event(types[i], repos[i], actors[i], start + step * i)
+
+    def make_event(
+        self,
+        event_type: str,
+        repo: Dict[str, Any],
+        actor: Dict[str, Any],
+        created_at: datetime,
+    ) -> Dict[str, Any]:
+        """Build a single raw event of the given type."""
+        event_id = self.next_id
+        self.next_id += 1
+        builder = getattr(self, f"_payload_{event_type}", None)
+        event = {
+            "id": str(event_id),
+            "type": event_type,
+            "actor": actor,
+            "repo": {"id": repo["id"], "name": repo["name"], "url": repo["url"]},
+            "payload": builder(repo, actor, created_at) if builder else {},
+            "public": True,
+            "created_at": created_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        if repo["org"]:
+            event["org"] = repo["org"]
+        return event
+
+    def _make_repo(self, index: int) -> Dict[str, Any]:
+        owner = f"owner{index % 20_000}"
+        name = f"{owner}/project-{index}"
+        org = None
+        if index % 5 == 0:
+            org = {
+                "id": 10_000_000 + index,
+                "login": owner,
+                "gravatar_id": "",
+                "url": f"{API_ROOT}/orgs/{owner}",
+                "avatar_url": f"https://avatars.githubusercontent.com/u/{10_000_000 + index}?",
+            }
+        return {
+            "id": 500_000_000 + index,
+            "name": name,
+            "url": f"{API_ROOT}/repos/{name}",
+            "org": org,
+        }
+
+    def _make_actor(self, index: int) -> Dict[str, Any]:
+        login = f"user-{index}" if index % 10 else f"bot-{index}[bot]"
+        return {
+            "id": 1_000_000 + index,
+            "login": login,
+            "display_login": login.replace("[bot]", ""),
+            "gravatar_id": "",
+            "url": f"{API_ROOT}/users/{login}",
+            "avatar_url": f"https://avatars.githubusercontent.com/u/{1_000_000 + index}?",
+        }
+
+    def _sha(self) -> str:
+        return "%040x" % self.random.getrandbits(160)
+
+    def _text(self, size: int) -> str:
+        offset = self.random.randrange(max(len(self._filler) - size, 1))
+        return self._filler[offset : offset + size]
+
+    def _user(self, actor: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "login": actor["login"],
+            "id": actor["id"],
+            "url": actor["url"],
+            "type": "Bot" if actor["login"].endswith("[bot]") else "User",
+            "site_admin": False,
+        }
+
+    def _issue(self, repo, actor, created_at, number: int) -> Dict[str, Any]:
+        url = f"{repo['url']}/issues/{number}"
+        timestamp = created_at.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return {
+            "url": url,
+            "repository_url": repo["url"],
+            "comments_url": f"{url}/comments",
+            "html_url": f"https://github.com/{repo['name']}/issues/{number}",
+            "id": self.random.randrange(2_000_000_000, 4_000_000_000),
+            "number": number,
+            "title": self._text(40),
+            "user": self._user(actor),
+            "labels": [],
+            "state": "open",
+            "locked": False,
+            "assignee": None,
+            "assignees": [],
+            "comments": self.random.randrange(10),
+            "created_at": timestamp,
+            "updated_at": timestamp,
+            "closed_at": None,
+            "author_association": "OWNER",
+            "body": self._text(self.body_size // 2),
+        }
+
+    def _pull_request(self, repo, actor, created_at, number: int) -> Dict[str, Any]:
+        pull = self._issue(repo, actor, created_at, number)
+        url = f"{repo['url']}/pulls/{number}"
+        pull.update(
+            {
+                "url": url,
+                "html_url": f"https://github.com/{repo['name']}/pull/{number}",
+                "diff_url": f"https://github.com/{repo['name']}/pull/{number}.diff",
+                "body": self._text(self.body_size),
+                "merged_at": None,
+                "merge_commit_sha": self._sha(),
+                "requested_reviewers": [],
+                "draft": False,
+                "head": {
+                    "ref": "feature",
+                    "sha": self._sha(),
+                    "repo": {"id": repo["id"]},
+                },
+                "base": {"ref": "main", "sha": self._sha(), "repo": {"id": repo["id"]}},
+                "merged": False,
+                "commits": self.random.randrange(1, 20),
+                "additions": self.random.randrange(500),
+                "deletions": self.random.randrange(500),
+                "changed_files": self.random.randrange(1, 30),
+            }
+        )
+        return pull
+
+    def _payload_PushEvent(self, repo, actor, created_at):
+        size = self.random.choices([1, 2, 3, 5], [70, 15, 10, 5])[0]
+        commits = [
+            {
+                "sha": self._sha(),
+                "author": {
+                    "email": f"{actor['login']}@example.com",
+                    "name": actor["login"],
+                },
+                "message": self._text(60),
+                "distinct": True,
+                "url": f"{repo['url']}/commits/{self._sha()}",
+            }
+            for _ in range(size)
+        ]
+        return {
+            "repository_id": repo["id"],
+            "push_id": self.random.randrange(24_000_000_000, 25_000_000_000),
+            "size": size,
+            "distinct_size": size,
+            "ref": "refs/heads/main",
+            "head": commits[-1]["sha"],
+            "before": self._sha(),
+            "commits": commits,
+        }
+
+    def _payload_CreateEvent(self, repo, actor, created_at):
+        return {
+            "ref": f"feature-{self.random.randrange(10_000)}",
+            "ref_type": self.random.choice(["branch", "tag", "repository"]),
+            "master_branch": "main",
+            "description": self._text(40),
+            "pusher_type": "user",
+        }
+
+    def _payload_DeleteEvent(self, repo, actor, created_at):
+        return {
+            "ref": f"feature-{self.random.randrange(10_000)}",
+            "ref_type": "branch",
+            "pusher_type": "user",
+        }
+
+    def _payload_WatchEvent(self, repo, actor, created_at):
+        return {"action": "started"}
+
+    def _payload_PublicEvent(self, repo, actor, created_at):
+        return {}
+
+    def _payload_ForkEvent(self, repo, actor, created_at):
+        name = f"{actor['login']}/{repo['name'].split('/')[1]}"
+        return {
+            "forkee": {
+                "id": self.random.randrange(900_000_000, 1_000_000_000),
+                "name": name.split("/")[1],
+                "full_name": name,
+                "owner": self._user(actor),
+                "fork": True,
+                "url": f"{API_ROOT}/repos/{name}",
+                "description": self._text(80),
+            }
+        }
+
+    def _payload_PullRequestEvent(self, repo, actor, created_at):
+        number = self.random.randrange(1, 5_000)
+        return {
+            "action": self.random.choices(
+                ["opened", "closed", "reopened"], [57, 42, 1]
+            )[0],
+            "number": number,
+            "pull_request": self._pull_request(repo, actor, created_at, number),
+        }
+
+    def _payload_PullRequestReviewEvent(self, repo, actor, created_at):
+        number = self.random.randrange(1, 5_000)
+        return {
+            "action": "created",
+            "review": {
+                "id": self.random.randrange(2_000_000_000, 3_000_000_000),
+                "user": self._user(actor),
+                "body": self._text(200),
+                "state": self.random.choice(["approved", "commented"]),
+            },
+            "pull_request": self._pull_request(repo, actor, created_at, number),
+        }
+
+    def _payload_PullRequestReviewCommentEvent(self, repo, actor, created_at):
+        number = self.random.randrange(1, 5_000)
+        return {
+            "action": "created",
+            "comment": {
+                "id": self.random.randrange(2_000_000_000, 3_000_000_000),
+                "user": self._user(actor),
+                "path": "src/main.py",
+                "body": self._text(200),
+            },
+            "pull_request": self._pull_request(repo, actor, created_at, number),
+        }
+
+    def _payload_IssuesEvent(self, repo, actor, created_at):
+        return {
+            "action": self.random.choices(
+                ["opened", "closed", "reopened"], [57, 42, 1]
+            )[0],
+            "issue": self._issue(
+                repo, actor, created_at, self.random.randrange(1, 5_000)
+            ),
+        }
+
+    def _payload_IssueCommentEvent(self, repo, actor, created_at):
+        number = self.random.randrange(1, 5_000)
+        return {
+            "action": "created",
+            "issue": self._issue(repo, actor, created_at, number),
+            "comment": {
+                "id": self.random.randrange(2_000_000_000, 3_000_000_000),
+                "user": self._user(actor),
+                "body": self._text(300),
+            },
+        }
+
+    def _payload_CommitCommentEvent(self, repo, actor, created_at):
+        return {
+            "comment": {
+                "id": self.random.randrange(150_000_000, 160_000_000),
+                "user": self._user(actor),
+                "commit_id": self._sha(),
+                "body": self._text(300),
+            }
+        }
+
+    def _payload_ReleaseEvent(self, repo, actor, created_at):
+        tag = f"v{self.random.randrange(10)}.{self.random.randrange(20)}.0"
+        return {
+            "action": "published",
+            "release": {
+                "id": self.random.randrange(200_000_000, 300_000_000),
+                "tag_name": tag,
+                "name": tag,
+                "author": self._user(actor),
+                "body": self._text(500),
+                "assets": [],
+            },
+        }
+
+    def _payload_MemberEvent(self, repo, actor, created_at):
+        return {"member": self._user(actor), "action": "added"}
+
+    def _payload_GollumEvent(self, repo, actor, created_at):
+        return {
+            "pages": [
+                {
+                    "page_name": "Home",
+                    "title": "Home",
+                    "action": "edited",
+                    "sha": self._sha(),
+                    "html_url": f"https://github.com/{repo['name']}/wiki/Home",
+                }
+            ]
+        }
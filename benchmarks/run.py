@@ -0,0 +1,353 @@
+"""
+Benchmark Runner
+
+Scripted end-to-end benchmarks for the GitHub Event Monitor:
+
+- ingestion: bronze ingestion from the local GitHub events stub (events/sec)
+- silver: bronze-to-silver load of the ingested files (events/sec)
+- api: p50/p99 latency of every endpoint in `api.py` on a populated silver table
+
+Usage:
+
+    python -m benchmarks.run all --rows 1000000
+    python -m benchmarks.run api --rows 10000000 --data-dir /tmp/gem-bench
+
+The package reads its data directory and GitHub URL from the environment at
+import time, so it is imported only after those are pointed at the benchmark
+workspace and the stub server.
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from benchmarks.generator import SyntheticEventGenerator
+from benchmarks.stub_server import GitHubEventsStub
+
+logger = logging.getLogger("benchmarks")
+
+FILTERED_TYPES = ["WatchEvent", "PullRequestEvent", "IssuesEvent"]
+POPULATE_BATCH_SIZE = 10_000
+
+
+def configure_environment(
+    data_dir: Path, stub: GitHubEventsStub, pages: int, backend: str
+):
+    """Point the application config at the benchmark workspace and the stub."""
+    os.environ["DATA_DIR"] = str(data_dir)
+    os.environ["SILVER_BACKEND"] = backend
+    os.environ["GITHUB_API_URL"] = stub.url
+    os.environ["GITHUB_TOKEN"] = ""
+    os.environ["PAGE_DELAY_SECONDS"] = "0"
+    os.environ["MAX_PAGES_PER_COLLECTION"] = str(pages)
+    os.environ["PER_PAGE"] = str(stub.max_per_page)
+
+
+def bench_ingestion(events: int) -> Dict[str, Any]:
+    """Time one bronze ingestion run that drains the whole stub feed."""
+    from github_event_monitor.medallion.bronze import BronzeLayerIngestion
+
+    bronze = BronzeLayerIngestion()
+    started = time.perf_counter()
+    files = bronze.ingest_events()
+    elapsed = time.perf_counter() - started
+    return {
+        "events": events,
+        "files": len(files),
+        "seconds": elapsed,
+        "events_per_sec": events / elapsed if elapsed else None,
+        "_files": files,
+    }
+
+
+def bench_silver(files: List[Path], events: int) -> Dict[str, Any]:
+    """Time the bronze-to-silver load of the given bronze files."""
+    from github_event_monitor.medallion.silver import SilverLayerTransformation
+
+    silver = SilverLayerTransformation()
+    silver.initialize()
+    started = time.perf_counter()
+    loaded = silver.process_bronze_files(files)
+    elapsed = time.perf_counter() - started
+    return {
+        "events_read": events,
+        "events_loaded": loaded,
+        "seconds": elapsed,
+        "events_per_sec": events / elapsed if elapsed else None,
+    }
+
+
+def populate_silver(rows: int, body_size: int) -> int:
+    """
+    Bulk-load synthetic filtered events into the silver table until it holds `rows`.
+
+    Rows are transformed and stored by the silver layer's own code so that the
+    tables look exactly like ones built by the pipeline. Existing rows are kept,
+    so a workspace can be reused across runs.
+
+    Returns:
+        Number of rows inserted
+    """
+    from sqlalchemy import func, select
+
+    from github_event_monitor.database import get_sync_session
+    from github_event_monitor.medallion.silver import SilverLayerTransformation
+    from github_event_monitor.models import Event
+
+    silver = SilverLayerTransformation()
+    silver.initialize()
+    storage = silver.storage
+    with get_sync_session(storage.engine) as session:
+        existing = session.execute(select(func.count()).select_from(Event)).scalar()
+    missing = rows - existing
+    if missing <= 0:
+        logger.info(f"Silver table already holds {existing} rows")
+        return 0
+
+    generator = SyntheticEventGenerator(body_size=body_size, event_types=FILTERED_TYPES)
+    generator.next_id += existing
+    end = datetime.now(timezone.utc)
+    span = timedelta(hours=24) / rows
+    inserted = 0
+    while inserted < missing:
+        batch_size = min(POPULATE_BATCH_SIZE, missing - inserted)
+        batch_end = end - span * (missing - inserted - batch_size)
+        batch_start = batch_end - span * (batch_size - 1)
+        batch = [
+            silver._transform_event(event)
+            for event in generator.iter_events(batch_size, batch_start, batch_end)
+        ]
+        with get_sync_session(storage.engine) as session:
+            generation = storage.next_generation(session)
+            for event in batch:
+                event["generation"] = generation
+            storage.insert_new_events(session, batch)
+            session.commit()
+        inserted += batch_size
+        logger.info(f"Populated {existing + inserted}/{rows} silver rows")
+    return inserted
+
+
+def start_api_server() -> tuple:
+    """Serve the API router on a free local port in a background thread."""
+    import socket
+
+    import uvicorn
+    from fastapi import FastAPI
+
+    from github_event_monitor import config
+    from github_event_monitor.api import router
+
+    app = FastAPI()
+    app.include_router(router, prefix=config.API_PREFIX)
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, f"http://127.0.0.1:{port}{config.API_PREFIX}"
+
+
+def measure_latency(call: Callable[[], Any], requests_count: int) -> Dict[str, Any]:
+    """Call an endpoint repeatedly and return latency percentiles in milliseconds."""
+    call()  # Warm up caches and connection
+    samples = []
+    for _ in range(requests_count):
+        started = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "requests": requests_count,
+        "p50_ms": statistics.median(samples),
+        "p99_ms": samples[min(int(len(samples) * 0.99), len(samples) - 1)],
+        "max_ms": samples[-1],
+    }
+
+
+def bench_api(requests_count: int) -> Dict[str, Dict[str, Any]]:
+    """Measure latency for every API endpoint against the populated silver table."""
+    import requests
+
+    server, base_url = start_api_server()
+    session = requests.Session()
+
+    def get(path: str, stream: bool = False, **params) -> Callable[[], Any]:
+        def call():
+            response = session.get(f"{base_url}{path}", params=params, timeout=300)
+            response.raise_for_status()
+            # Streamed responses are read to the end but not decoded
+            return len(response.content) if stream else response.json()
+
+        return call
+
+    def with_cursor(path: str, **params) -> Callable[[], Any]:
+        """Call a `/changes` endpoint with the cursor of an earlier full count."""
+        cursor = get(path, **params)()["cursor"]
+        return get(path, cursor=cursor, **params)
+
+    try:
+        top_repo = get("/repositories/active", limit=1, offset=1440)()
+        repo = top_repo[0]["repository"] if top_repo else "owner0/project-0"
+        export_start = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+        endpoints = {
+            "GET /events/count?offset=10": get("/events/count", offset=10),
+            "GET /events/count?offset=1440": get("/events/count", offset=1440),
+            "GET /repositories/active?offset=60": get(
+                "/repositories/active", limit=10, offset=60
+            ),
+            "GET /repositories/active?offset=1440": get(
+                "/repositories/active", limit=10, offset=1440
+            ),
+            "GET /repository/{top}/avg_pr_time": get(f"/repository/{repo}/avg_pr_time"),
+            "GET /repositories/with_multiple_prs": get(
+                "/repositories/with_multiple_prs"
+            ),
+            "GET /events/count/changes?offset=60": with_cursor(
+                "/events/count/changes", offset=60
+            ),
+            "GET /repositories/active/changes?offset=60": with_cursor(
+                "/repositories/active/changes", offset=60
+            ),
+            "GET /repositories/with_multiple_prs/changes": with_cursor(
+                "/repositories/with_multiple_prs/changes"
+            ),
+            # A day of 1 minute buckets for every type is downsampled
+            "GET /events/rate?offset=1440&bucket=1m": get(
+                "/events/rate", offset=1440, bucket="1m"
+            ),
+            "GET /events/export (last hour, ndjson)": get(
+                "/events/export", stream=True, start=export_start
+            ),
+        }
+        results = {}
+        for name, call in endpoints.items():
+            logger.info(f"Measuring {name}")
+            results[name] = measure_latency(call, requests_count)
+        return results
+    finally:
+        server.should_exit = True
+
+
+def print_report(results: Dict[str, Any]):
+    if "ingestion" in results:
+        r = results["ingestion"]
+        print(
+            f"ingestion: {r['events']} events in {r['seconds']:.2f}s "
+            f"-> {r['events_per_sec']:.0f} events/sec ({r['files']} files)"
+        )
+    if "silver" in results:
+        r = results["silver"]
+        print(
+            f"silver:    {r['events_read']} events ({r['events_loaded']} loaded) in "
+            f"{r['seconds']:.2f}s -> {r['events_per_sec']:.0f} events/sec"
+        )
+    if "api" in results:
+        print(f"api:       {results['rows']} silver rows ({results['backend']})")
+        for name, r in results["api"].items():
+            print(
+                f"  {name:<46} p50 {r['p50_ms']:>9.2f} ms   "
+                f"p99 {r['p99_ms']:>9.2f} ms   ({r['requests']} requests)"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GitHub Event Monitor benchmarks.")
+    parser.add_argument(
+        "suite", choices=["ingestion", "silver", "api", "all"], nargs="?", default="all"
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=1_000_000,
+        help="Silver rows to populate for the API benchmark (e.g. 1000000, 10000000).",
+    )
+    parser.add_argument(
+        "--events",
+        type=int,
+        default=20_000,
+        help="Events served by the stub for the ingestion and silver benchmarks.",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=50, help="Requests per API endpoint."
+    )
+    parser.add_argument(
+        "--body-size", type=int, default=1_000, help="Characters of text per body."
+    )
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        help="Benchmark workspace (reused between runs). Defaults to a temp dir.",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["sqlite", "duckdb"],
+        default="sqlite",
+        help="Silver layer storage backend.",
+    )
+    parser.add_argument("--output", type=Path, help="Write results as JSON here.")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    data_dir = args.data_dir or Path(tempfile.mkdtemp(prefix="gem-bench-"))
+    results: Dict[str, Any] = {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "data_dir": str(data_dir),
+        "backend": args.backend,
+    }
+
+    with GitHubEventsStub() as stub:
+        pages = (args.events + stub.max_per_page - 1) // stub.max_per_page
+        configure_environment(data_dir, stub, pages, args.backend)
+
+        if args.suite in ("ingestion", "silver", "all"):
+            from github_event_monitor import config
+            from github_event_monitor.storage import get_storage
+
+            generator = SyntheticEventGenerator(body_size=args.body_size)
+            stub.publish(generator.generate(args.events))
+            shutil.rmtree(data_dir / "bronze", ignore_errors=True)
+            # Use a scratch database (which also holds the bronze manifest) so
+            # the API rows are not disturbed
+            scratch = data_dir / "silver" / f"ingestion_benchmark.{args.backend}"
+            for path in scratch.parent.glob(f"{scratch.name}*"):
+                path.unlink()
+            config.SILVER_DB_URL = f"{args.backend}:///{scratch}"
+            try:
+                get_storage().initialize()
+                ingestion = bench_ingestion(args.events)
+                files = ingestion.pop("_files")
+                results["ingestion"] = ingestion
+                if args.suite in ("silver", "all"):
+                    results["silver"] = bench_silver(files, args.events)
+            finally:
+                config.SILVER_DB_URL = f"{args.backend}:///{config.SILVER_DB_PATH}"
+
+    if args.suite in ("api", "all"):
+        populate_silver(args.rows, args.body_size)
+        results["rows"] = args.rows
+        results["api"] = bench_api(args.requests)
+
+    print_report(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Startup Report
+
+Measures the cold start of `main.py` for each process role: the time taken
+to import it, the memory of the process afterwards, which heavy packages it
+loaded, and the packages whose imports cost the most (from `python -X
+importtime`). Roles with a dashboard also report the cost of building it,
+which is deferred to the first dashboard request.
+
+Usage:
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --role api-only --top 20
+
+Every measurement runs in a fresh interpreter so no module is already
+cached. Memory is the peak resident set size (Unix only).
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+ROLES = {
+    "full": [],
+    "dashboard-only": ["--dashboard-only"],
+    "api-only": ["--api-only"],
+}
+
+HEAVY_MODULES = ["dash", "pandas", "plotly", "requests", "apscheduler", "pyarrow"]
+
+# Runs in the child interpreter with the main.py flags and HEAVY_MODULES as argv
+PROBE = """
+import json, resource, sys, time
+flags, heavy = json.loads(sys.argv[1]), json.loads(sys.argv[2])
+sys.argv = ["main.py", *flags]
+started = time.perf_counter()
+import main
+result = {"import_seconds": time.perf_counter() - started}
+result["modules"] = len(sys.modules)
+result["max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+result["loaded"] = [m for m in heavy if m in sys.modules]
+if not getattr(main, "API_ONLY", False):
+    started = time.perf_counter()
+    import github_event_monitor.visualization
+    result["dashboard_seconds"] = time.perf_counter() - started
+    result["dashboard_max_rss_kb"] = resource.getrusage(
+        resource.RUSAGE_SELF
+    ).ru_maxrss
+print(json.dumps(result))
+"""
+
+
+def parse_importtime(stderr: str) -> Dict[str, float]:
+    """Sum the self time (ms) of `-X importtime` output per top-level package."""
+    packages: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, _, name = line.split(":", 1)[1].split("|")
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + int(self_us) / 1000
+    return packages
+
+
+def measure_role(flags: List[str], data_dir: Path) -> Dict[str, Any]:
+    """Import `main.py` with the given flags in a fresh interpreter."""
+    env = dict(os.environ, DATA_DIR=str(data_dir), PYTHONPATH=str(REPO_ROOT))
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            PROBE,
+            json.dumps(flags),
+            json.dumps(HEAVY_MODULES),
+        ],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["packages_ms"] = parse_importtime(completed.stderr)
+    return result
+
+
+def print_report(results: Dict[str, Dict[str, Any]], top: int):
+    for role, r in results.items():
+        print(
+            f"{role}: import {r['import_seconds'] * 1000:.0f} ms, "
+            f"{r['max_rss_kb'] / 1024:.1f} MB RSS, {r['modules']} modules"
+        )
+        print(f"  heavy packages loaded: {', '.join(r['loaded']) or 'none'}")
+        if "dashboard_seconds" in r:
+            print(
+                f"  dashboard build (first request): "
+                f"{r['dashboard_seconds'] * 1000:.0f} ms, "
+                f"{r['dashboard_max_rss_kb'] / 1024:.1f} MB RSS after"
+            )
+        slowest = sorted(r["packages_ms"].items(), key=lambda p: p[1], reverse=True)
+        for package, ms in slowest[:top]:
+            print(f"    {ms:>9.1f} ms  {package}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report startup cost per role.")
+    parser.add_argument(
+        "--role", choices=list(ROLES), action="append", help="Role(s) to measure."
+    )
+    parser.add_argument("--top", type=int, default=10, help="Slowest packages to list.")
+    parser.add_argument("--output", type=Path, help="Write results as JSON here.")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="gem-startup-") as data_dir:
+        for role in args.role or list(ROLES):
+            results[role] = measure_role(ROLES[role], Path(data_dir))
+
+    print_report(results, args.top)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
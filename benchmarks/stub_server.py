@@ -0,0 +1,149 @@
+"""
+GitHub Events API Stub
+
+A local stand-in for `https://api.github.com/events` that serves synthetic
+events with the same pagination, ETag and rate-limit behaviour.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class GitHubEventsStub:
+    """
+    Serves a feed of events newest first on `/events`.
+
+    Supports `page`/`per_page` query parameters, `Link` headers with
+    `next`/`last` relations, `ETag`/`If-None-Match` conditional requests
+    (answered with 304) and `X-RateLimit-*` headers (403 once exhausted).
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        rate_limit: int = 5000,
+        max_per_page: int = 100,
+    ):
+        self.rate_limit = rate_limit
+        self.max_per_page = max_per_page
+        self.requests_served = 0
+        self._events: List[Dict[str, Any]] = []
+        self._pages: Dict[tuple, tuple] = {}
+        self._remaining = rate_limit
+        self._reset_at = int(time.time()) + 3600
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/events"
+
+    def publish(self, events: List[Dict[str, Any]]):
+        """Add events (ordered oldest first) to the head of the feed."""
+        with self._lock:
+            self._events = list(reversed(events)) + self._events
+            self._pages.clear()
+
+    def reset_rate_limit(self):
+        with self._lock:
+            self._remaining = self.rate_limit
+            self._reset_at = int(time.time()) + 3600
+
+    def start(self) -> "GitHubEventsStub":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"GitHub events stub listening on {self.url}")
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _render_page(self, page: int, per_page: int) -> tuple:
+        """Return the (body, etag, last_page) tuple for a page, cached per feed state."""
+        key = (page, per_page)
+        with self._lock:
+            if key not in self._pages:
+                start = (page - 1) * per_page
+                body = json.dumps(self._events[start : start + per_page]).encode()
+                etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+                last_page = max((len(self._events) + per_page - 1) // per_page, 1)
+                self._pages[key] = (body, etag, last_page)
+            return self._pages[key]
+
+    def _take_rate_limit(self) -> bool:
+        with self._lock:
+            self.requests_served += 1
+            if self._remaining <= 0:
+                return False
+            self._remaining -= 1
+            return True
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if parsed.path != "/events":
+                    return self._send(404, b'{"message": "Not Found"}')
+                if not stub._take_rate_limit():
+                    return self._send(403, b'{"message": "API rate limit exceeded"}')
+
+                query = parse_qs(parsed.query)
+                page = max(int(query.get("page", ["1"])[0]), 1)
+                per_page = min(
+                    max(int(query.get("per_page", ["30"])[0]), 1), stub.max_per_page
+                )
+                body, etag, last_page = stub._render_page(page, per_page)
+                headers = {"ETag": etag, "Link": self._link(page, per_page, last_page)}
+                if self.headers.get("If-None-Match") == etag:
+                    return self._send(304, b"", headers)
+                self._send(200, body, headers)
+
+            def _link(self, page: int, per_page: int, last_page: int) -> str:
+                base = f"{stub.url}?per_page={per_page}"
+                links = []
+                if page < last_page:
+                    links.append(f'<{base}&page={page + 1}>; rel="next"')
+                links.append(f'<{base}&page={last_page}>; rel="last"')
+                return ", ".join(links)
+
+            def _send(self, status: int, body: bytes, headers: Dict[str, str] = None):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("X-RateLimit-Limit", str(stub.rate_limit))
+                self.send_header("X-RateLimit-Remaining", str(max(stub._remaining, 0)))
+                self.send_header("X-RateLimit-Reset", str(stub._reset_at))
+                self.send_header(
+                    "X-RateLimit-Used", str(stub.rate_limit - stub._remaining)
+                )
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        return Handler
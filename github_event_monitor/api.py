@@ -3,20 +3,41 @@ API Module
 
 Sync version, querying directly from the Silver (events) table.
 """
+import io
+import json
 import logging
-from typing import Dict
-from fastapi import APIRouter, HTTPException, Query
+import math
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.routing import APIRoute
 
 from sqlalchemy.orm import Session
-from sqlalchemy import create_engine, func, desc
+from sqlalchemy import String, cast, func, desc, select, type_coerce
 
 from github_event_monitor import config
-from github_event_monitor.models import Event
+from github_event_monitor.storage import get_storage
+from github_event_monitor.models import Actor, Event, Repository
+from github_event_monitor.profiling import API, TARGETS, profiled, profiler
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
 
-engine = create_engine(config.SILVER_DB_URL, future=True)
+
+class ProfiledRoute(APIRoute):
+    """Route whose endpoint is profiled while API profiling is armed."""
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        if not path.startswith("/admin"):
+            endpoint = profiled(API, label=path)(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+
+router = APIRouter(route_class=ProfiledRoute)
+
+storage = get_storage()
+engine = storage.read_engine
 
 
 def get_session():
@@ -64,12 +85,19 @@ def get_active_repositories(
         now = datetime.now(timezone.utc)
         window_start = now - timedelta(minutes=offset)
         with Session(engine) as session:
-            rows = (
-                session.query(Event.repo, func.count().label("cnt"))
+            # Rank integer repo IDs, then join names for the top rows only
+            top = (
+                session.query(Event.repo_id, func.count().label("cnt"))
                 .filter(Event.created_at >= window_start)
-                .group_by(Event.repo)
+                .group_by(Event.repo_id)
                 .order_by(desc("cnt"))
                 .limit(limit)
+                .subquery()
+            )
+            rows = (
+                session.query(Repository.name, top.c.cnt)
+                .join(top, Repository.id == top.c.repo_id)
+                .order_by(desc(top.c.cnt))
                 .all()
             )
             return [{"repository": repo, "event_count": cnt} for repo, cnt in rows]
@@ -88,7 +116,12 @@ def get_avg_pr_time(repo: str):
             # Get all PR events for this repo, sorted by time
             pr_events = (
                 session.query(Event)
-                .filter(Event.repo == repo, Event.type == "PullRequestEvent")
+                .filter(
+                    Event.repo_id.in_(
+                        select(Repository.id).where(Repository.name == repo)
+                    ),
+                    Event.type == "PullRequestEvent",
+                )
                 .order_by(Event.created_at)
                 .all()
             )
@@ -118,15 +151,491 @@ def get_avg_pr_time(repo: str):
 def get_repos_with_multiple_prs():
     try:
         with Session(engine) as session:
-            repos = (
-                session.query(Event.repo)
+            multiple = (
+                session.query(Event.repo_id, func.count(Event.id).label("cnt"))
                 .filter(Event.type == "PullRequestEvent")
-                .group_by(Event.repo)
+                .group_by(Event.repo_id)
                 .having(func.count(Event.id) > 1)
-                .order_by(func.count(Event.id).desc())
+                .subquery()
+            )
+            repos = (
+                session.query(Repository.name)
+                .join(multiple, Repository.id == multiple.c.repo_id)
+                .order_by(multiple.c.cnt.desc())
                 .all()
             )
             return [repo[0] for repo in repos]
     except Exception as e:
         logger.error(f"Error fetching repos with >1 PR: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+# ---- Incremental (cursor based) endpoints ----
+#
+# Every silver load batch stamps its rows with a new `generation`. A cursor
+# records the generation and window start a client last saw, so a follow-up
+# request only counts the rows loaded since then and the rows that slid out
+# of (or back into) the time window. Responses carry per-key count deltas;
+# without a cursor the deltas are the full counts and `reset` is true.
+
+
+def _parse_cursor(cursor: Optional[str]) -> Tuple[Optional[int], Optional[datetime]]:
+    """Split a `<generation>[:<window start epoch>]` cursor into its parts."""
+    if cursor is None:
+        return None, None
+    try:
+        generation, _, window_start = cursor.partition(":")
+        return int(generation), (
+            datetime.fromtimestamp(int(window_start), timezone.utc)
+            if window_start
+            else None
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+
+
+def _make_cursor(generation: int, window_start: Optional[datetime]) -> str:
+    if window_start is None:
+        return str(generation)
+    return f"{generation}:{int(window_start.timestamp())}"
+
+
+def _window_start(offset: int) -> datetime:
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    return now - timedelta(minutes=offset)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Convert a query bound to UTC, as timestamps are stored; naive means UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _count_changes(
+    session: Session,
+    key,
+    cursor: Optional[str],
+    window_start: Optional[datetime] = None,
+    *criteria,
+) -> Dict[str, Any]:
+    """
+    Count rows per `key` that changed since `cursor`.
+
+    Args:
+        session: Database session
+        key: Column to group by
+        cursor: Cursor returned by a previous call, or None for a full snapshot
+        window_start: Lower bound on `created_at`, or None for all time
+        criteria: Additional filters applied to every count
+
+    Returns:
+        Dict with the new `cursor`, `reset` flag and per-key `changes`
+    """
+    since, since_window_start = _parse_cursor(cursor)
+    generation = session.query(func.max(Event.generation)).scalar() or 0
+
+    def counts(*filters):
+        rows = (
+            session.query(key, func.count())
+            .filter(*criteria, *filters)
+            .group_by(key)
+            .all()
+        )
+        return {k: cnt for k, cnt in rows}
+
+    def in_window(start):
+        return [Event.created_at >= start] if start is not None else []
+
+    changes: Dict[str, int] = {}
+    if since is None:
+        changes = counts(Event.generation <= generation, *in_window(window_start))
+    else:
+        # Rows loaded since the cursor that fall inside the current window
+        changes = counts(
+            Event.generation > since,
+            Event.generation <= generation,
+            *in_window(window_start),
+        )
+        # Rows the client already counted whose window membership changed
+        if window_start is not None and since_window_start is not None:
+            if window_start != since_window_start:
+                sign = 1 if window_start < since_window_start else -1
+                lower, upper = sorted([window_start, since_window_start])
+                moved = counts(
+                    Event.generation <= since,
+                    Event.created_at >= lower,
+                    Event.created_at < upper,
+                )
+                for k, cnt in moved.items():
+                    changes[k] = changes.get(k, 0) + sign * cnt
+        changes = {k: delta for k, delta in changes.items() if delta}
+
+    return {
+        "cursor": _make_cursor(generation, window_start),
+        "reset": since is None,
+        "changes": changes,
+    }
+
+
+def _by_repository_name(session: Session, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Re-key the changes of a `_count_changes` result from repo IDs to names."""
+    names = storage.repository_names(session, result["changes"])
+    changes: Dict[str, int] = {}
+    for repo_id, delta in result["changes"].items():
+        name = names.get(repo_id, str(repo_id))
+        changes[name] = changes.get(name, 0) + delta
+    result["changes"] = {name: delta for name, delta in changes.items() if delta}
+    return result
+
+
+@router.get("/events/count/changes")
+def get_event_count_changes(
+    offset: int = Query(10, description="Time offset in minutes"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous call"),
+):
+    """
+    Get the change in event counts by type since `cursor` for the last `offset` minutes.
+    """
+    try:
+        with Session(engine) as session:
+            return _count_changes(session, Event.type, cursor, _window_start(offset))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting event count changes: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/repositories/active/changes")
+def get_active_repository_changes(
+    offset: int = Query(60, description="Time offset in minutes"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous call"),
+):
+    """
+    Get the change in event counts per repository since `cursor` for the last
+    `offset` minutes. Clients keep the merged counts and rank them locally.
+    """
+    try:
+        with Session(engine) as session:
+            return _by_repository_name(
+                session,
+                _count_changes(session, Event.repo_id, cursor, _window_start(offset)),
+            )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting active repo changes: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/repositories/with_multiple_prs/changes")
+def get_repo_pr_count_changes(
+    cursor: Optional[str] = Query(None, description="Cursor from a previous call"),
+):
+    """
+    Get the change in PullRequestEvent counts per repository since `cursor`.
+    """
+    try:
+        with Session(engine) as session:
+            return _by_repository_name(
+                session,
+                _count_changes(
+                    session,
+                    Event.repo_id,
+                    cursor,
+                    None,
+                    Event.type == "PullRequestEvent",
+                ),
+            )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting repo PR count changes: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+# ---- Event rate series ----
+
+# Bucket widths a client can ask for, in seconds
+BUCKET_SECONDS = {"1m": 60, "5m": 300, "1h": 3600}
+# Widths a wide range is downsampled to; beyond a day, whole days are used
+DOWNSAMPLE_SECONDS = [60, 300, 900, 3600, 6 * 3600, 24 * 3600]
+
+
+def _bucket_range(start: datetime, end: datetime, width: int) -> Tuple[int, int]:
+    """Return the first and last epoch bucket numbers covering [`start`, `end`)."""
+    first = int(start.timestamp()) // width
+    last = (math.ceil(end.timestamp()) - 1) // width
+    return first, max(last, first)
+
+
+def _downsampled_width(
+    start: datetime, end: datetime, requested: int, series: int, max_points: int
+) -> int:
+    """Return the smallest width >= `requested` that keeps the series under `max_points`."""
+
+    def fits(width: int) -> bool:
+        first, last = _bucket_range(start, end, width)
+        return (last - first + 1) * series <= max_points
+
+    for width in DOWNSAMPLE_SECONDS:
+        if width >= requested and fits(width):
+            return width
+    day = DOWNSAMPLE_SECONDS[-1]
+    days = max(math.ceil((end - start).total_seconds() * series / day / max_points), 1)
+    while not fits(days * day):
+        days += 1
+    return days * day
+
+
+@router.get("/events/rate")
+def get_event_rate(
+    offset: int = Query(60, ge=1, description="Time offset in minutes"),
+    start: Optional[datetime] = Query(None, description="Start (overrides offset)"),
+    end: Optional[datetime] = Query(None, description="End of the range (now)"),
+    bucket: str = Query("1m", pattern=f"^({'|'.join(BUCKET_SECONDS)})$"),
+    event_type: Optional[str] = Query(None, alias="type", description="Event type"),
+    max_points: int = Query(
+        1000, ge=10, le=100_000, description="Maximum buckets x types returned"
+    ),
+):
+    """
+    Get event counts per type in fixed time buckets over a range.
+
+    Buckets are aligned to the Unix epoch, so the first and last may be partial.
+    When the range holds more than `max_points` buckets across all types, the
+    bucket width is widened and `downsampled` is true.
+    """
+    end = _as_utc(end or datetime.now(timezone.utc))
+    start = _as_utc(start or end - timedelta(minutes=offset))
+    if start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
+    types: List[str] = [event_type] if event_type else config.EVENT_TYPES_FILTER
+    requested = BUCKET_SECONDS[bucket]
+    width = _downsampled_width(start, end, requested, len(types), max_points)
+    first, last = _bucket_range(start, end, width)
+    try:
+        with Session(engine) as session:
+            bucket_number = storage.time_bucket(Event.created_at, width)
+            # One pass over the created_at index, grouped in the database
+            rows = (
+                session.query(Event.type, bucket_number, func.count())
+                .filter(
+                    Event.created_at >= start,
+                    Event.created_at < end,
+                    Event.type.in_(types),
+                )
+                .group_by(Event.type, bucket_number)
+                .all()
+            )
+    except Exception as e:
+        logger.error(f"Error getting event rate: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    series = {event_type: [0] * (last - first + 1) for event_type in types}
+    for row_type, number, count in rows:
+        index = int(number) - first
+        # Guards against a backend rounding a boundary row into a neighbour bucket
+        if 0 <= index <= last - first:
+            series[row_type][index] += count
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "bucket_seconds": width,
+        "downsampled": width != requested,
+        "timestamps": [
+            datetime.fromtimestamp(number * width, timezone.utc).isoformat()
+            for number in range(first, last + 1)
+        ],
+        "series": series,
+    }
+
+
+# ---- Bulk export ----
+
+EXPORT_COLUMNS = [
+    "id",
+    "type",
+    "actor",
+    "actor_id",
+    "repo",
+    "repo_id",
+    "public",
+    "created_at",
+    "payload",
+]
+
+
+def _export_batches(
+    start: datetime, end: Optional[datetime], event_type: Optional[str], batch_size: int
+) -> Iterator[list]:
+    """
+    Yield lists of at most `batch_size` export rows, oldest first.
+
+    Rows are streamed from a server-side cursor, so memory use does not grow
+    with the size of the time range. Payloads are read as raw JSON text.
+    """
+    stmt = (
+        select(
+            # Exported as text, as GitHub serves event IDs
+            cast(Event.id, String),
+            Event.type,
+            Actor.login,
+            Event.actor_id,
+            Repository.name,
+            Event.repo_id,
+            Event.public,
+            Event.created_at,
+            type_coerce(Event.payload, String),
+        )
+        .outerjoin(Actor, Actor.id == Event.actor_id)
+        .outerjoin(Repository, Repository.id == Event.repo_id)
+        .where(Event.created_at >= start)
+        .order_by(Event.created_at, Event.id)
+    )
+    if end is not None:
+        stmt = stmt.where(Event.created_at < end)
+    if event_type:
+        stmt = stmt.where(Event.type == event_type)
+    try:
+        with Session(engine) as session:
+            result = session.execute(stmt.execution_options(yield_per=batch_size))
+            for rows in result.partitions():
+                yield rows
+    except Exception as e:
+        # Headers are already sent, so the client sees a truncated stream
+        logger.error(f"Error streaming event export: {str(e)}")
+        raise
+
+
+def _ndjson_stream(batches: Iterator[list]) -> Iterator[bytes]:
+    for rows in batches:
+        lines = []
+        for row in rows:
+            record = dict(zip(EXPORT_COLUMNS[:-1], row[:-1]))
+            record["created_at"] = record["created_at"].isoformat() + "Z"
+            # Splice the stored payload text in instead of parsing and re-encoding it
+            lines.append(
+                f'{json.dumps(record)[:-1]}, "payload": {row[-1] or "null"}}}\n'
+            )
+        yield "".join(lines).encode()
+
+
+def _import_pyarrow():
+    """Import pyarrow on the first Arrow export; it is optional and slow to load."""
+    try:
+        import pyarrow
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def _arrow_stream(pa, batches: Iterator[list]) -> Iterator[bytes]:
+    schema = pa.schema(
+        [
+            ("id", pa.string()),
+            ("type", pa.string()),
+            ("actor", pa.string()),
+            ("actor_id", pa.int64()),
+            ("repo", pa.string()),
+            ("repo_id", pa.int64()),
+            ("public", pa.bool_()),
+            ("created_at", pa.timestamp("us", tz="UTC")),
+            ("payload", pa.string()),  # JSON text
+        ]
+    )
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for rows in batches:
+            columns = list(zip(*rows))
+            writer.write_batch(pa.record_batch(columns, schema=schema))
+            yield sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+    yield sink.getvalue()
+
+
+@router.get("/events/export")
+def export_events(
+    start: datetime = Query(..., description="Start of the time range (inclusive)"),
+    end: Optional[datetime] = Query(None, description="End of the time range"),
+    event_type: Optional[str] = Query(None, alias="type", description="Event type"),
+    format: str = Query("ndjson", pattern="^(ndjson|arrow)$"),
+    batch_size: int = Query(5000, ge=1, le=100_000, description="Rows per chunk"),
+):
+    """
+    Stream the silver events created in [`start`, `end`) as chunked NDJSON or
+    an Arrow IPC stream, oldest first.
+    """
+    pa = _import_pyarrow() if format == "arrow" else None
+    if format == "arrow" and pa is None:
+        raise HTTPException(
+            status_code=501, detail="Arrow export requires the 'pyarrow' package"
+        )
+    start = _as_utc(start)
+    end = _as_utc(end) if end is not None else None
+
+    batches = _export_batches(start, end, event_type, batch_size)
+    if format == "arrow":
+        return StreamingResponse(
+            _arrow_stream(pa, batches), media_type="application/vnd.apache.arrow.stream"
+        )
+    return StreamingResponse(_ndjson_stream(batches), media_type="application/x-ndjson")
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Allow admin endpoints only with the configured `ADMIN_TOKEN`."""
+    if not config.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(
+        x_admin_token, config.ADMIN_TOKEN
+    ):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+def _profiling_status() -> Dict[str, Any]:
+    return {
+        "remaining": {target: profiler.remaining(target) for target in TARGETS},
+        "profiles": [
+            {
+                "name": path.name,
+                "size": path.stat().st_size,
+                "modified": datetime.fromtimestamp(
+                    path.stat().st_mtime, timezone.utc
+                ).isoformat(),
+            }
+            for path in profiler.profiles()[:50]
+        ],
+    }
+
+
+@router.post("/admin/profile", dependencies=[Depends(require_admin)])
+def arm_profiling(
+    target: str = Query(..., pattern=f"^({'|'.join(TARGETS)})$"),
+    count: int = Query(1, ge=0, le=1000, description="Calls to profile, 0 disarms"),
+):
+    """
+    Profile the next `count` pipeline runs or API requests.
+
+    API requests are counted per worker process; pipeline runs are picked up
+    by whichever worker is the pipeline leader.
+    """
+    profiler.arm(target, count)
+    return _profiling_status()
+
+
+@router.get("/admin/profile", dependencies=[Depends(require_admin)])
+def get_profiling_status():
+    """List the profiles written so far (newest first) and the armed counts."""
+    return _profiling_status()
+
+
+@router.get("/admin/profile/{name}", dependencies=[Depends(require_admin)])
+def download_profile(name: str):
+    """Download a profile in folded-stack format."""
+    for path in profiler.profiles():
+        if path.name == name:
+            return FileResponse(path, media_type="text/plain")
+    raise HTTPException(status_code=404, detail="Profile not found")
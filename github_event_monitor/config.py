@@ -17,20 +17,23 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 load_dotenv(BASE_DIR / ".env")
 
 # Data storage paths for Medallion Architecture
-DATA_DIR = BASE_DIR / "data"
+DATA_DIR = Path(os.getenv("DATA_DIR", BASE_DIR / "data"))
 BRONZE_DIR = DATA_DIR / "bronze"
 SILVER_DIR = DATA_DIR / "silver"
+# Directories are created by the components that write to them, not on import
 
-# Ensure directories exist
-for directory in [DATA_DIR, BRONZE_DIR, SILVER_DIR]:
-    directory.mkdir(exist_ok=True, parents=True)
+# Database settings - local SQLite (default) or DuckDB database file
+SILVER_BACKEND = os.getenv("SILVER_BACKEND", "sqlite")
+SILVER_DB_PATH = SILVER_DIR / (
+    "github_events.duckdb" if SILVER_BACKEND == "duckdb" else "github_events.db"
+)
+SILVER_DB_URL = f"{SILVER_BACKEND}:///{SILVER_DB_PATH}"
 
-# Database settings - using local SQLite databases
-SILVER_DB_PATH = SILVER_DIR / "github_events.db"
-SILVER_DB_URL = f"sqlite:///{SILVER_DB_PATH}"
+# Lock file held by the single worker process that runs the data pipeline
+LEADER_LOCK_PATH = DATA_DIR / "pipeline.lock"
 
 # GitHub API settings
-GITHUB_API_URL = "https://api.github.com/events"
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com/events")
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")  # Personal Access Token for GitHub API
 EVENT_TYPES_FILTER = [
     "WatchEvent",
@@ -42,9 +45,17 @@ EVENT_TYPES_FILTER = [
 COLLECTION_INTERVAL_SECONDS = int(os.getenv("COLLECTION_INTERVAL_SECONDS", "15"))
 MAX_PAGES_PER_COLLECTION = int(os.getenv("MAX_PAGES_PER_COLLECTION", "3"))
 PER_PAGE = int(os.getenv("PER_PAGE", 100))  # 100 is the max for GitHub API
+PAGE_DELAY_SECONDS = float(os.getenv("PAGE_DELAY_SECONDS", "1"))  # Pause between pages
 
 # API settings
 API_PREFIX = "/api"
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")  # Enables the /api/admin endpoints
+
+# Profiling - sampled profiles of the next N pipeline runs / API requests
+PROFILE_DIR = DATA_DIR / "profiles"
+PROFILE_PIPELINE_RUNS = int(os.getenv("PROFILE_PIPELINE_RUNS", "0"))
+PROFILE_API_REQUESTS = int(os.getenv("PROFILE_API_REQUESTS", "0"))
+PROFILE_SAMPLE_INTERVAL_MS = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "1"))
 
 # Dashboard settings
 DASHBOARD_PREFIX = "/dashboard"
@@ -53,5 +64,5 @@ DASHBOARD_PREFIX = "/dashboard"
 # Function to generate bronze layer file path
 def get_bronze_file_path():
     """Generate a file path for storing raw GitHub events in the bronze layer."""
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
     return BRONZE_DIR / f"github_events_{timestamp}.json"
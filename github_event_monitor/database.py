@@ -5,13 +5,14 @@ This module handles database connections and provides session management.
 """
 import logging
 from contextlib import contextmanager
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 logger = logging.getLogger(__name__)
 
 # Cache for database engines
 _engines = {}
+_read_only_engines = {}
 
 
 def get_engine(database_url):
@@ -35,6 +36,40 @@ def get_engine(database_url):
     return _engines[database_url]
 
 
+def get_read_only_engine(database_url):
+    """
+    Get or create an engine whose connections refuse writes.
+
+    Used by the API so that any number of worker processes can read the
+    silver layer while only the pipeline leader writes to it.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        Engine instance
+    """
+    if database_url not in _read_only_engines:
+        engine = create_engine(
+            database_url,
+            echo=False,
+            connect_args={"check_same_thread": False}
+            if "sqlite" in database_url
+            else {},
+        )
+        if "sqlite" in database_url:
+
+            @event.listens_for(engine, "connect")
+            def _set_query_only(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA query_only = ON")
+                cursor.execute("PRAGMA busy_timeout = 5000")
+                cursor.close()
+
+        _read_only_engines[database_url] = engine
+    return _read_only_engines[database_url]
+
+
 @contextmanager
 def get_sync_session(engine):
     """
@@ -0,0 +1,77 @@
+"""
+Leader Election Module
+
+This module elects a single process to run the data pipeline when the
+application is served by several workers, using an exclusive lock file.
+"""
+import logging
+import os
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderLock:
+    """
+    Non-blocking exclusive lock on a file shared by all worker processes.
+
+    The operating system releases the lock when the holding process exits,
+    so a follower that keeps calling `acquire` takes over after a crash.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._file is not None
+
+    def acquire(self) -> bool:
+        """
+        Try to become the leader without blocking.
+
+        Returns:
+            True if this process holds the lock
+        """
+        if self.is_leader:
+            return True
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        lock_file = open(self.path, "a+")
+        try:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            return False
+        # Record the holder for operators; the lock itself is what counts
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._file = lock_file
+        logger.info(f"Process {os.getpid()} acquired leader lock {self.path}")
+        return True
+
+    def release(self):
+        if not self.is_leader:
+            return
+        try:
+            if fcntl:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
+        logger.info(f"Process {os.getpid()} released leader lock {self.path}")
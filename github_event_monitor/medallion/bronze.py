@@ -6,6 +6,7 @@ and stores it in the bronze layer as JSON files.
 """
 import json
 import logging
+import os
 import time
 import requests
 from datetime import datetime
@@ -14,6 +15,7 @@ from typing import List, Dict, Any
 from urllib.parse import urlencode
 
 from github_event_monitor import config
+from github_event_monitor.medallion.manifest import BronzeManifest
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +26,8 @@ class BronzeLayerIngestion:
     and stores it in the bronze layer as JSON files.
     """
 
-    def __init__(self):
+    def __init__(self, manifest: BronzeManifest = None):
+        self.manifest = manifest or BronzeManifest()
         self.api_url = (
             f"{config.GITHUB_API_URL}?{urlencode({'per_page': config.PER_PAGE})}"
         )
@@ -52,6 +55,8 @@ class BronzeLayerIngestion:
             stored_files = []
             next_url = self.api_url
             page_count = 0
+            # Events come newest first; stop at the first page we have fully seen
+            checkpoint = self.manifest.checkpoint()
 
             while next_url and page_count < config.MAX_PAGES_PER_COLLECTION:
                 logger.info(f"Fetching page {page_count + 1} from {next_url}")
@@ -61,13 +66,21 @@ class BronzeLayerIngestion:
                     if not events_data:
                         logger.info("No events found in the response")
                         break
+                    if checkpoint is not None and all(
+                        int(event["id"]) <= checkpoint for event in events_data
+                    ):
+                        logger.info(
+                            f"Page {page_count + 1} is older than checkpoint "
+                            f"{checkpoint}, stopping"
+                        )
+                        break
                     file_path = self._store_raw_data(events_data)
                     stored_files.append(file_path)
                     logger.info(f"Stored {len(events_data)} events in {file_path}")
 
                     next_url = self._get_next_page_url(response.headers.get("Link", ""))
                     page_count += 1
-                    time.sleep(1)
+                    time.sleep(config.PAGE_DELAY_SECONDS)
 
                 elif response.status_code == 403:
                     logger.error(
@@ -90,8 +103,14 @@ class BronzeLayerIngestion:
 
     def _store_raw_data(self, data: List[Dict[str, Any]]) -> Path:
         file_path = config.get_bronze_file_path()
-        with open(file_path, "w") as f:
+        # Write then rename, so a crash never leaves a truncated bronze file
+        tmp_path = file_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
             json.dump(data, f)
+        # Recorded before the rename: a file in BRONZE_DIR always has a
+        # manifest row, and a row whose file is missing is resolved on load
+        self.manifest.record_fetched(file_path, data)
+        os.replace(tmp_path, file_path)
         return file_path
 
     def _get_next_page_url(self, link_header: str) -> str:
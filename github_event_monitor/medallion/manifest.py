@@ -0,0 +1,109 @@
+"""
+Bronze Manifest Module
+
+This module keeps a durable manifest of bronze files in the silver database,
+so that files fetched before a crash are loaded exactly once on restart and
+ingestion can stop at events it has already seen.
+"""
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from github_event_monitor import config
+from github_event_monitor.database import get_sync_session
+from github_event_monitor.models import BronzeFile
+from github_event_monitor.storage import SilverStorage, get_storage
+
+logger = logging.getLogger(__name__)
+
+FETCHED = "fetched"
+LOADED = "loaded"
+FAILED = "failed"
+
+
+class BronzeManifest:
+    """
+    Records every bronze file with its state and event ID range.
+
+    A file is `fetched` once it is written, and becomes `loaded` in the same
+    transaction that inserts its events into the silver layer. Files that
+    cannot be read are marked `failed` and are not retried. A file is recorded
+    before it is renamed into place, so a crash in between leaves a row whose
+    file is missing; such rows are dropped to be refetched.
+    """
+
+    def __init__(self, storage: SilverStorage = None):
+        self._storage = storage
+
+    @property
+    def storage(self) -> SilverStorage:
+        # Resolved lazily so the backend follows config.SILVER_DB_URL
+        return self._storage or get_storage()
+
+    def checkpoint(self) -> Optional[int]:
+        """Return the newest event ID in any recorded bronze file."""
+        with get_sync_session(self.storage.engine) as session:
+            return session.execute(select(func.max(BronzeFile.max_event_id))).scalar()
+
+    def record_fetched(self, file_path: Path, events_data: List[Dict[str, Any]]):
+        """Record a newly written bronze file as waiting to be loaded."""
+        event_ids = [int(event["id"]) for event in events_data if event.get("id")]
+        row = {
+            "name": file_path.name,
+            "state": FETCHED,
+            "event_count": len(events_data),
+            "min_event_id": min(event_ids, default=None),
+            "max_event_id": max(event_ids, default=None),
+            "fetched_at": datetime.now(timezone.utc),
+            "loaded_at": None,
+        }
+        with get_sync_session(self.storage.engine) as session:
+            session.execute(
+                self.storage.upsert(
+                    BronzeFile, [k for k in row if k != "name"], key="name"
+                ),
+                [row],
+            )
+            session.commit()
+
+    def pending_files(self) -> List[Path]:
+        """Return fetched but not yet loaded bronze files, oldest first."""
+        with get_sync_session(self.storage.engine) as session:
+            names = session.execute(
+                select(BronzeFile.name)
+                .where(BronzeFile.state == FETCHED)
+                .order_by(BronzeFile.name)
+            ).scalars()
+            return [config.BRONZE_DIR / name for name in names]
+
+    def mark_loaded(self, session: Session, file_path: Path):
+        """Mark a bronze file as loaded as part of the caller's transaction."""
+        self._set_state(session, file_path, LOADED)
+
+    def mark_failed(self, file_path: Path):
+        with get_sync_session(self.storage.engine) as session:
+            self._set_state(session, file_path, FAILED)
+            session.commit()
+        logger.warning(f"Bronze file {file_path} marked as failed")
+
+    def forget(self, file_path: Path):
+        """Drop a file's row, so its events are fetched again if still listed."""
+        with get_sync_session(self.storage.engine) as session:
+            session.execute(
+                delete(BronzeFile).where(BronzeFile.name == Path(file_path).name)
+            )
+            session.commit()
+        logger.warning(
+            f"Bronze file {file_path} is missing, its events will be refetched"
+        )
+
+    def _set_state(self, session: Session, file_path: Path, state: str):
+        session.execute(
+            update(BronzeFile)
+            .where(BronzeFile.name == Path(file_path).name)
+            .values(state=state, loaded_at=datetime.now(timezone.utc))
+        )
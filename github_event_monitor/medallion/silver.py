@@ -6,16 +6,15 @@ and loads it into the silver layer database.
 """
 import json
 import logging
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Dict, Any
 
-from sqlalchemy.dialects.sqlite import insert
-from sqlalchemy import select
-
 from github_event_monitor import config
-from github_event_monitor.models import Base, Event
-from github_event_monitor.database import get_engine, get_sync_session
+from github_event_monitor.database import get_sync_session
+from github_event_monitor.medallion.manifest import BronzeManifest
+from github_event_monitor.storage import SilverStorage, get_storage
 
 logger = logging.getLogger(__name__)
 
@@ -26,20 +25,34 @@ class SilverLayerTransformation:
     and loads it into the silver layer database.
     """
 
+    def __init__(self, storage: SilverStorage = None, manifest: BronzeManifest = None):
+        self._storage = storage
+        self.manifest = manifest or BronzeManifest(storage)
+
+    @property
+    def storage(self) -> SilverStorage:
+        # Resolved lazily so the backend follows config.SILVER_DB_URL
+        return self._storage or get_storage()
+
     def initialize(self):
-        engine = get_engine(config.SILVER_DB_URL)
-        with engine.begin() as conn:
-            Base.metadata.create_all(bind=conn)
-        logger.info(f"Silver layer database initialized at {config.SILVER_DB_PATH}")
+        self.storage.initialize()
+        logger.info(f"Silver layer database initialized at {self.storage.database_url}")
 
     def process_bronze_files(self, file_paths: List[Path]) -> int:
         total_processed = 0
         for file_path in file_paths:
             try:
-                with open(file_path, "r") as f:
+                with open(self._published(file_path), "r") as f:
                     events_data = json.load(f)
-
-                processed = self._transform_and_load(events_data)
+            except FileNotFoundError:
+                self.manifest.forget(file_path)
+                continue
+            except (OSError, ValueError) as e:
+                logger.error(f"Error reading bronze file {file_path}: {str(e)}")
+                self.manifest.mark_failed(file_path)
+                continue
+            try:
+                processed = self._transform_and_load(events_data, file_path)
                 total_processed += processed
 
                 logger.info(f"Processed {processed} events from {file_path}")
@@ -47,35 +60,39 @@ class SilverLayerTransformation:
                 logger.error(f"Error processing bronze file {file_path}: {str(e)}")
         return total_processed
 
-    def _transform_and_load(self, events_data: List[Dict[str, Any]]) -> int:
-        if not events_data:
-            return 0
-
-        processed_count = 0
-        engine = get_engine(config.SILVER_DB_URL)
-        with get_sync_session(engine) as session:
-            for event_data in events_data:
-                try:
-                    event_id = event_data.get("id")
-                    if not event_id:
-                        logger.warning(f"Event missing ID: {event_data}")
-                        continue
-
-                    existing = session.execute(
-                        select(Event).where(Event.id == event_id)
-                    ).scalar_one_or_none()
-                    if existing:
-                        continue
-
-                    event = self._transform_event(event_data)
-                    if not event:
-                        continue
-
-                    stmt = insert(Event).values(**event)
-                    session.execute(stmt)
-                    processed_count += 1
-                except Exception as e:
-                    logger.error(f"Error processing event: {str(e)}")
+    def _published(self, file_path: Path) -> Path:
+        """Finish the rename of a file recorded just before a crash."""
+        tmp_path = Path(file_path).with_suffix(".tmp")
+        if not Path(file_path).exists() and tmp_path.exists():
+            # Fully written: the manifest row is only recorded after the write
+            os.replace(tmp_path, file_path)
+            logger.info(f"Recovered bronze file {file_path}")
+        return file_path
+
+    def _transform_and_load(
+        self, events_data: List[Dict[str, Any]], file_path: Path = None
+    ) -> int:
+        events = []
+        for event_data in events_data:
+            try:
+                if not event_data.get("id"):
+                    logger.warning(f"Event missing ID: {event_data}")
+                    continue
+                event = self._transform_event(event_data)
+                if event:
+                    events.append(event)
+            except Exception as e:
+                logger.error(f"Error processing event: {str(e)}")
+
+        with get_sync_session(self.storage.engine) as session:
+            # Every row of this batch shares one generation, committed together
+            generation = self.storage.next_generation(session)
+            for event in events:
+                event["generation"] = generation
+            processed_count = self.storage.insert_new_events(session, events)
+            if file_path:
+                # Committed with the events, so a file is loaded exactly once
+                self.manifest.mark_loaded(session, file_path)
             session.commit()
         return processed_count
 
@@ -88,7 +105,7 @@ class SilverLayerTransformation:
                 )
                 return None
             event = {
-                "id": event_data.get("id"),
+                "id": int(event_data.get("id")),
                 "type": event_data.get("type"),
                 "actor": event_data.get("actor", {}).get("login"),
                 "actor_id": event_data.get("actor", {}).get("id"),
@@ -105,7 +122,9 @@ class SilverLayerTransformation:
                     event["id"],
                     event["type"],
                     event["actor"],
+                    event["actor_id"],
                     event["repo"],
+                    event["repo_id"],
                     event["created_at"],
                 ]
             ):
@@ -3,26 +3,73 @@ Database Models
 
 This module defines the database models for the application.
 """
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, JSON
+from sqlalchemy import BigInteger, Column, String, Integer, Boolean, DateTime, JSON
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
 
+# 64-bit GitHub IDs; plain INTEGER on SQLite keeps primary keys as rowid aliases
+GitHubId = BigInteger().with_variant(Integer, "sqlite")
+
+
+class Repository(Base):
+    """GitHub repository dimension for the silver layer, keyed by GitHub's repo ID."""
+
+    __tablename__ = "repos"
+
+    id = Column(GitHubId, primary_key=True, autoincrement=False)
+    name = Column(String, index=True)
+
+    def __repr__(self):
+        return f"<Repository(id={self.id}, name={self.name})>"
+
+
+class Actor(Base):
+    """GitHub actor dimension for the silver layer, keyed by GitHub's actor ID."""
+
+    __tablename__ = "actors"
+
+    id = Column(GitHubId, primary_key=True, autoincrement=False)
+    login = Column(String, index=True)
+
+    def __repr__(self):
+        return f"<Actor(id={self.id}, login={self.login})>"
+
 
 class Event(Base):
     """GitHub event model for the silver layer."""
 
     __tablename__ = "events"
 
-    id = Column(String, primary_key=True, index=True)
+    # GitHub's numeric event ID; an INTEGER primary key is the rowid on SQLite
+    id = Column(GitHubId, primary_key=True, autoincrement=False)
     type = Column(String, index=True)
-    actor = Column(String, index=True)
-    actor_id = Column(Integer, index=True)
-    repo = Column(String, index=True)
-    repo_id = Column(Integer, index=True)
+    # References to the repos/actors dimensions (no FK constraints, so that
+    # dimension names can be upserted on every backend)
+    actor_id = Column(GitHubId, index=True)
+    repo_id = Column(GitHubId, index=True)
     public = Column(Boolean, default=True)
     created_at = Column(DateTime, index=True)
     payload = Column(JSON)
+    # Silver load batch that inserted the row; used as the API change cursor
+    generation = Column(Integer, index=True, default=0)
+
+    def __repr__(self):
+        return f"<Event(id={self.id}, type={self.type}, repo_id={self.repo_id})>"
+
+
+class BronzeFile(Base):
+    """Manifest entry tracking a bronze file from fetch to silver load."""
+
+    __tablename__ = "bronze_files"
+
+    name = Column(String, primary_key=True)  # File name within the bronze directory
+    state = Column(String, index=True)  # "fetched", "loaded" or "failed"
+    event_count = Column(Integer)
+    min_event_id = Column(GitHubId)
+    max_event_id = Column(GitHubId, index=True)
+    fetched_at = Column(DateTime)
+    loaded_at = Column(DateTime)
 
     def __repr__(self):
-        return f"<Event(id={self.id}, type={self.type}, repo={self.repo})>"
+        return f"<BronzeFile(name={self.name}, state={self.state})>"
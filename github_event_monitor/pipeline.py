@@ -7,7 +7,9 @@ import logging
 from datetime import datetime, timezone
 
 from github_event_monitor.medallion.bronze import BronzeLayerIngestion
+from github_event_monitor.medallion.manifest import BronzeManifest
 from github_event_monitor.medallion.silver import SilverLayerTransformation
+from github_event_monitor.profiling import PIPELINE, profiled
 
 logger = logging.getLogger(__name__)
 
@@ -18,14 +20,16 @@ class DataPipeline:
     """
 
     def __init__(self):
-        self.bronze = BronzeLayerIngestion()
-        self.silver = SilverLayerTransformation()
+        self.manifest = BronzeManifest()
+        self.bronze = BronzeLayerIngestion(manifest=self.manifest)
+        self.silver = SilverLayerTransformation(manifest=self.manifest)
 
     def initialize(self):
         """Initialize the pipeline components."""
         self.silver.initialize()
         logger.info("Data pipeline initialized")
 
+    @profiled(PIPELINE, label="run")
     def run(self):
         """Run the complete data pipeline."""
         try:
@@ -36,17 +40,22 @@ class DataPipeline:
             bronze_files = self.bronze.ingest_events()
             logger.info(f"Bronze layer ingestion completed: {len(bronze_files)} files")
 
-            if not bronze_files:
+            # Files fetched by this or an interrupted earlier run, not yet loaded
+            pending_files = self.manifest.pending_files()
+            resumed = len(set(pending_files) - set(bronze_files))
+            if resumed:
+                logger.info(f"Resuming {resumed} unfinished bronze files")
+
+            if not pending_files:
                 logger.info("No new data to process")
                 return
 
             # Silver layer: Transform and load data
-            processed_count = self.silver.process_bronze_files(bronze_files)
+            processed_count = self.silver.process_bronze_files(pending_files)
             logger.info(
                 f"Silver layer transformation completed: {processed_count} events processed"
             )
 
-            end_time = datetime.now(timezone.utc)
             end_time = datetime.now(timezone.utc)
             duration = (end_time - start_time).total_seconds()
             logger.info(f"Data pipeline run completed in {duration:.2f} seconds")
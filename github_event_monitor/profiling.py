@@ -0,0 +1,255 @@
+"""
+Profiling Module
+
+This module captures opt-in sampled profiles of pipeline runs and API
+requests, written as folded stacks (the input format of flamegraph.pl,
+speedscope and inferno), and logs the SQL statements they execute with
+their timings.
+
+Profiling is armed for the next N pipeline runs or API requests, either at
+startup through `PROFILE_PIPELINE_RUNS` / `PROFILE_API_REQUESTS` or at
+runtime through the admin endpoints in `api.py`. Unarmed calls only pay for
+a counter check.
+"""
+import functools
+import inspect
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from github_event_monitor import config
+
+logger = logging.getLogger(__name__)
+
+PIPELINE = "pipeline"
+API = "api"
+TARGETS = [PIPELINE, API]
+
+
+class StackSampler:
+    """
+    Samples the Python stack of one thread at a fixed interval.
+
+    Stacks are counted in folded form: frames from the root to the leaf
+    joined by `;`.
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+
+    def start(self) -> "StackSampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                module = frame.f_globals.get("__name__", "?")
+                frames.append(f"{module}:{code.co_qualname}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(frames))] += 1
+
+
+class Capture:
+    """Profile and SQL timings of a single profiled call."""
+
+    def __init__(self, target: str, label: str):
+        self.target = target
+        self.label = label
+        self.started_at = datetime.now(timezone.utc)
+        self.statements: List[tuple] = []
+        self.sampler = StackSampler(
+            threading.get_ident(), config.PROFILE_SAMPLE_INTERVAL_MS / 1000
+        )
+
+
+class Profiler:
+    """
+    Decides which calls are profiled and writes their profiles.
+
+    API requests are armed per process. The pipeline count is kept in a file
+    in the profile directory, so that a worker serving the admin endpoint can
+    arm, and report on, the pipeline run by the elected leader.
+    """
+
+    def __init__(self):
+        self.profile_dir = Path(config.PROFILE_DIR)
+        self._remaining: Dict[str, int] = {
+            PIPELINE: config.PROFILE_PIPELINE_RUNS,
+            API: config.PROFILE_API_REQUESTS,
+        }
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._listening = False
+
+    def arm(self, target: str, count: int):
+        """Profile the next `count` calls of `target` (0 disarms)."""
+        if target == PIPELINE:
+            # The pipeline may run in another worker (the elected leader)
+            self._write_pipeline_count(count)
+        else:
+            with self._lock:
+                self._remaining[target] = count
+        logger.info(f"Profiling armed for the next {count} {target} calls")
+
+    def remaining(self, target: str) -> int:
+        """Return the calls of `target` still to profile, as seen by this process."""
+        if target == PIPELINE:
+            count = self._read_pipeline_count()
+            if count is not None:
+                return count
+        with self._lock:
+            return self._remaining[target]
+
+    def profiles(self) -> List[Path]:
+        """Return the written profiles, newest first."""
+        if not self.profile_dir.exists():
+            return []
+        return sorted(
+            self.profile_dir.glob("*.folded"),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+
+    @contextmanager
+    def capture(self, target: str, label: str = ""):
+        """Profile the enclosed block if `target` is armed."""
+        if getattr(self._local, "capture", None) or not self._take(target):
+            yield
+            return
+        self._listen_to_sql()
+        capture = Capture(target, label)
+        self._local.capture = capture
+        started = time.perf_counter()
+        capture.sampler.start()
+        try:
+            yield
+        finally:
+            stacks = capture.sampler.stop()
+            self._local.capture = None
+            self._write(capture, stacks, time.perf_counter() - started)
+
+    def _take(self, target: str) -> bool:
+        """Consume one armed call of `target`, if any."""
+        with self._lock:
+            if target == PIPELINE:
+                shared = self._read_pipeline_count()
+                if shared is not None:
+                    self._remaining[PIPELINE] = shared
+            if self._remaining[target] <= 0:
+                return False
+            self._remaining[target] -= 1
+            if target == PIPELINE:
+                # Written back so that every worker reports the same count
+                self._write_pipeline_count(self._remaining[PIPELINE])
+            return True
+
+    def _pipeline_path(self) -> Path:
+        return self.profile_dir / f"{PIPELINE}.remaining"
+
+    def _read_pipeline_count(self) -> Optional[int]:
+        """Return the shared pipeline count, or None if it was never written."""
+        try:
+            return int(self._pipeline_path().read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_pipeline_count(self, count: int):
+        self.profile_dir.mkdir(exist_ok=True, parents=True)
+        path = self._pipeline_path()
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(str(count))
+        os.replace(tmp_path, path)
+
+    def _write(self, capture: Capture, stacks: Counter, duration: float):
+        self.profile_dir.mkdir(exist_ok=True, parents=True)
+        timestamp = capture.started_at.strftime("%Y%m%d_%H%M%S_%f")
+        label = re.sub(r"[^A-Za-z0-9]+", "_", capture.label).strip("_")
+        name = "_".join(part for part in (capture.target, label, timestamp) if part)
+        path = self.profile_dir / f"{name}.folded"
+        path.write_text("".join(f"{stack} {n}\n" for stack, n in stacks.items()))
+
+        sql_seconds = sum(seconds for seconds, _ in capture.statements)
+        logger.info(
+            f"Profile of {capture.target} {capture.label} written to {path}: "
+            f"{duration:.3f}s, {sum(stacks.values())} samples, "
+            f"{len(capture.statements)} SQL statements in {sql_seconds:.3f}s"
+        )
+
+    def _listen_to_sql(self):
+        """Time every statement run by a thread that is being profiled."""
+        # Under the lock, so concurrent first captures register only once
+        with self._lock:
+            if self._listening:
+                return
+            self._listening = True
+            event.listen(Engine, "before_cursor_execute", self._before_execute)
+            event.listen(Engine, "after_cursor_execute", self._after_execute)
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, many):
+        if getattr(self._local, "capture", None):
+            conn.info.setdefault("profile_started", []).append(time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, many):
+        capture = getattr(self._local, "capture", None)
+        started = conn.info.get("profile_started")
+        if not capture or not started:
+            return
+        seconds = time.perf_counter() - started.pop()
+        capture.statements.append((seconds, statement))
+        logger.info(f"SQL {seconds * 1000:.2f} ms: {' '.join(statement.split())}")
+
+
+profiler = Profiler()
+
+
+def profiled(target: str, label: str = "") -> Callable:
+    """Decorate a function (sync or async) so armed calls are profiled."""
+
+    def decorator(func: Callable) -> Callable:
+        name = label or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with profiler.capture(target, name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profiler.capture(target, name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,40 @@
+"""
+Storage Package
+
+This package contains the storage backends of the silver layer. Every
+backend implements the `SilverStorage` interface; `get_storage` picks one
+from the scheme of the database URL.
+"""
+from github_event_monitor import config
+from github_event_monitor.storage.base import SilverStorage
+
+# Cache for storage backends
+_storages = {}
+
+
+def get_storage(database_url=None) -> SilverStorage:
+    """
+    Get or create the storage backend for the given URL.
+
+    Args:
+        database_url: SQLAlchemy database URL (default: config.SILVER_DB_URL)
+
+    Returns:
+        SilverStorage instance
+    """
+    database_url = database_url or config.SILVER_DB_URL
+    if database_url not in _storages:
+        if database_url.startswith("sqlite"):
+            from github_event_monitor.storage.sqlite_backend import SQLiteStorage
+
+            _storages[database_url] = SQLiteStorage(database_url)
+        elif database_url.startswith("duckdb"):
+            from github_event_monitor.storage.duckdb_backend import DuckDBStorage
+
+            _storages[database_url] = DuckDBStorage(database_url)
+        else:
+            raise ValueError(f"Unsupported silver database URL: {database_url}")
+    return _storages[database_url]
+
+
+__all__ = ["SilverStorage", "get_storage"]
@@ -0,0 +1,158 @@
+"""
+Storage Base Module
+
+This module defines the interface shared by all silver layer storage backends.
+"""
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List
+
+from sqlalchemy import event as sqlalchemy_event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from github_event_monitor.database import get_engine
+from github_event_monitor.models import Actor, Base, Event, Repository
+
+
+class SilverStorage(ABC):
+    """
+    Base class for silver layer storage backends.
+
+    Subclasses provide the dialect specific pieces: how to open engines and
+    which INSERT construct supports ON CONFLICT clauses.
+
+    Events are stored as a fact table of integers; repository names and actor
+    logins live in the `repos` and `actors` dimensions. Name-to-ID caches of
+    the dimension rows already stored let loads skip unchanged dimensions.
+    """
+
+    # Whether several processes may open the database at the same time
+    multi_process = True
+
+    def __init__(self, database_url: str):
+        self.database_url = database_url
+        self._repo_ids: Dict[str, int] = {}
+        self._actor_ids: Dict[str, int] = {}
+
+    @property
+    def engine(self) -> Engine:
+        """Engine used by the pipeline to write to the silver layer."""
+        return get_engine(self.database_url)
+
+    @property
+    def read_engine(self) -> Engine:
+        """Engine used by the API to query the silver layer."""
+        return self.engine
+
+    def initialize(self):
+        """Create missing tables and columns."""
+        self._ensure_database_dir()
+        with self.engine.begin() as conn:
+            Base.metadata.create_all(bind=conn)
+
+    def _ensure_database_dir(self):
+        """Create the directory holding a file-based database."""
+        database = self.engine.url.database
+        if database and database != ":memory:":
+            Path(database).parent.mkdir(exist_ok=True, parents=True)
+
+    @abstractmethod
+    def dialect_insert(self, table):
+        """Return the dialect's INSERT construct (with ON CONFLICT support) for `table`."""
+
+    @abstractmethod
+    def time_bucket(self, column, width: int):
+        """
+        Return an integer SQL expression numbering the `width`-second bucket of
+        the timestamp `column`, counted from the Unix epoch.
+        """
+
+    def insert_ignore(self, table):
+        """Return an INSERT for `table` that skips rows with an existing primary key."""
+        return self.dialect_insert(table).on_conflict_do_nothing(index_elements=["id"])
+
+    def upsert(self, table, columns: List[str], key: str = "id"):
+        """Return an INSERT for `table` that overwrites `columns` on an existing `key`."""
+        stmt = self.dialect_insert(table)
+        return stmt.on_conflict_do_update(
+            index_elements=[key],
+            set_={column: stmt.excluded[column] for column in columns},
+        )
+
+    def next_generation(self, session: Session) -> int:
+        """Return the generation number for the next silver load batch."""
+        return (session.execute(select(func.max(Event.generation))).scalar() or 0) + 1
+
+    def insert_new_events(self, session: Session, events: List[Dict[str, Any]]) -> int:
+        """
+        Insert events whose ID is not stored yet, along with their dimensions.
+
+        Args:
+            session: Database session, committed by the caller
+            events: Transformed event rows, with `repo` and `actor` names
+
+        Returns:
+            Number of events inserted
+        """
+        # Last occurrence wins for duplicate IDs within the batch
+        events_by_id = {event["id"]: event for event in events}
+        if not events_by_id:
+            return 0
+        existing = set(
+            session.execute(
+                select(Event.id).where(Event.id.in_(list(events_by_id)))
+            ).scalars()
+        )
+        new_events = [
+            event
+            for event_id, event in events_by_id.items()
+            if event_id not in existing
+        ]
+        if new_events:
+            self._upsert_dimensions(session, new_events)
+            facts = [
+                {k: v for k, v in event.items() if k not in ("repo", "actor")}
+                for event in new_events
+            ]
+            session.execute(self.insert_ignore(Event), facts)
+        return len(new_events)
+
+    def _upsert_dimensions(self, session: Session, events: List[Dict[str, Any]]):
+        """Write repository and actor names that are new or renamed."""
+        dimensions = [
+            (Repository, "name", "repo", "repo_id", self._repo_ids),
+            (Actor, "login", "actor", "actor_id", self._actor_ids),
+        ]
+        pending = []
+        for table, column, name_key, id_key, cache in dimensions:
+            changed = {
+                event[name_key]: event[id_key]
+                for event in events
+                if cache.get(event[name_key]) != event[id_key]
+            }
+            if changed:
+                session.execute(
+                    self.upsert(table, [column]),
+                    [{"id": id_, column: name} for name, id_ in changed.items()],
+                )
+                pending.append((cache, changed))
+
+        if not pending:
+            return
+
+        # Only trust the caches once the rows are durable
+        @sqlalchemy_event.listens_for(session, "after_commit", once=True)
+        def _update_caches(session):
+            for cache, changed in pending:
+                cache.update(changed)
+
+    def repository_names(self, session: Session, repo_ids) -> Dict[int, str]:
+        """Look up the names of the given repository IDs."""
+        ids = list(set(repo_ids))
+        if not ids:
+            return {}
+        rows = session.execute(
+            select(Repository.id, Repository.name).where(Repository.id.in_(ids))
+        )
+        return {repo_id: name for repo_id, name in rows}
@@ -0,0 +1,56 @@
+"""
+DuckDB Storage Module
+
+This module stores the silver layer in an embedded DuckDB database file,
+a columnar engine suited to analytic windows over many millions of events.
+"""
+from sqlalchemy import BigInteger, cast, create_engine, event, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Engine
+
+from github_event_monitor.storage.base import SilverStorage
+
+try:
+    import duckdb_engine  # noqa: F401  Registers the duckdb:// dialect
+except ImportError:
+    duckdb_engine = None
+
+
+class DuckDBStorage(SilverStorage):
+    """
+    Silver layer stored in DuckDB.
+
+    DuckDB allows a single process to open a database file for writing, so
+    the pipeline and the API must share one process (no `--workers`).
+    """
+
+    multi_process = False
+
+    def __init__(self, database_url: str):
+        if duckdb_engine is None:
+            raise ImportError(
+                "The DuckDB silver backend requires the 'duckdb' and "
+                "'duckdb-engine' packages: poetry install --extras duckdb"
+            )
+        super().__init__(database_url)
+        self._engine = None
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            self._engine = create_engine(self.database_url, echo=False)
+
+            @event.listens_for(self._engine, "connect")
+            def _set_utc(dbapi_connection, connection_record):
+                # Timestamps are stored as naive UTC, as in SQLite
+                dbapi_connection.execute("SET TimeZone = 'UTC'")
+
+        return self._engine
+
+    def time_bucket(self, column, width: int):
+        # DuckDB's `/` is true division, so floor the epoch seconds explicitly
+        return cast(func.floor(func.epoch(column) / width), BigInteger)
+
+    def dialect_insert(self, table):
+        # duckdb-engine compiles PostgreSQL's INSERT ... ON CONFLICT clauses
+        return insert(table)
@@ -0,0 +1,104 @@
+"""
+SQLite Storage Module
+
+This module stores the silver layer in a local SQLite database file.
+"""
+import logging
+
+from sqlalchemy import Integer, cast, func, inspect, text
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.engine import Engine
+
+from github_event_monitor.database import get_read_only_engine
+from github_event_monitor.models import Event
+from github_event_monitor.storage.base import SilverStorage
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteStorage(SilverStorage):
+    """
+    Silver layer stored in SQLite.
+
+    The database runs in WAL mode, so API workers in other processes keep
+    reading while the pipeline leader writes.
+    """
+
+    multi_process = True
+
+    @property
+    def read_engine(self) -> Engine:
+        return get_read_only_engine(self.database_url)
+
+    def initialize(self):
+        self._ensure_database_dir()
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+        super().initialize()
+        with self.engine.begin() as conn:
+            self._add_missing_columns(conn)
+
+    def _add_missing_columns(self, conn):
+        """Bring a silver database created by an earlier version up to date."""
+        columns = {
+            column["name"]: column["type"]
+            for column in inspect(conn).get_columns("events")
+        }
+        if "repo" in columns:
+            self._move_names_to_dimensions(conn)
+        if "generation" not in columns:
+            conn.execute(
+                text("ALTER TABLE events ADD COLUMN generation INTEGER DEFAULT 0")
+            )
+            conn.execute(
+                text("CREATE INDEX ix_events_generation ON events (generation)")
+            )
+            logger.info("Added generation column to the events table")
+        if not isinstance(columns["id"], Integer):
+            self._convert_event_ids(conn)
+
+    def _move_names_to_dimensions(self, conn):
+        """Move repository and actor names out of the events table."""
+        # The name on the newest event wins, as it does for live loads
+        for table, column, id_column, name_column in (
+            ("repos", "name", "repo_id", "repo"),
+            ("actors", "login", "actor_id", "actor"),
+        ):
+            conn.execute(
+                text(
+                    f"INSERT OR REPLACE INTO {table} (id, {column}) "
+                    f"SELECT {id_column}, {name_column} FROM ("
+                    f"SELECT {id_column}, {name_column}, ROW_NUMBER() OVER ("
+                    f"PARTITION BY {id_column} ORDER BY created_at DESC, id DESC"
+                    f") AS position FROM events) WHERE position = 1"
+                )
+            )
+        for column in ("repo", "actor"):
+            conn.execute(text(f"DROP INDEX IF EXISTS ix_events_{column}"))
+            conn.execute(text(f"ALTER TABLE events DROP COLUMN {column}"))
+        logger.info("Moved repository and actor names to dimension tables")
+
+    def _convert_event_ids(self, conn):
+        """Rebuild the events table with integer IDs in place of text ones."""
+        conn.execute(text("ALTER TABLE events RENAME TO events_text_ids"))
+        for index in inspect(conn).get_indexes("events_text_ids"):
+            conn.execute(text(f"DROP INDEX {index['name']}"))
+        Event.__table__.create(conn)
+        conn.execute(
+            text(
+                "INSERT INTO events (id, type, actor_id, repo_id, public, "
+                "created_at, payload, generation) "
+                "SELECT CAST(id AS INTEGER), type, actor_id, repo_id, public, "
+                "created_at, payload, generation FROM events_text_ids"
+            )
+        )
+        conn.execute(text("DROP TABLE events_text_ids"))
+        logger.info("Converted event IDs to integers")
+
+    def time_bucket(self, column, width: int):
+        # Timestamps are stored as naive UTC text; `//` on integers compiles to
+        # SQLite's integer division
+        return cast(func.strftime("%s", column), Integer) // width
+
+    def dialect_insert(self, table):
+        return insert(table)
@@ -1,8 +1,13 @@
+import heapq
+import logging
+import threading
+from collections import OrderedDict
+from operator import itemgetter
+
 import pandas as pd
 import requests
-import logging
 
-from dash import Dash, html, dcc, Input, Output, State
+from dash import Dash, Patch, html, dcc, no_update, Input, Output, State
 import plotly.express as px
 import plotly.graph_objects as go
 
@@ -17,6 +22,11 @@ dash_app.layout = html.Div(
         html.Button(
             "Refresh", id="refresh-btn", n_clicks=0, style={"marginBottom": "16px"}
         ),
+        # What each figure was last drawn from (a few keys at most); the merged
+        # counts themselves stay in the server-side ChangeCache
+        dcc.Store(id="event-type-store"),
+        dcc.Store(id="active-repos-store"),
+        dcc.Store(id="repo-pr-store"),
         html.Div(
             [
                 html.Div(
@@ -82,6 +92,39 @@ dash_app.layout = html.Div(
             ],
             className="chart-row",
         ),
+        html.Div(
+            [
+                html.H2("Event Rate"),
+                html.P("Events per time bucket by type over a time window."),
+                html.Div(
+                    [
+                        html.Label(
+                            "Time window (minutes):",
+                            style={"marginRight": "8px"},
+                        ),
+                        dcc.Input(
+                            id="event-rate-offset-input",
+                            type="number",
+                            value=1440,
+                            min=1,
+                            step=1,
+                            style={"width": "80px", "marginRight": "16px"},
+                        ),
+                        html.Label("Bucket:", style={"marginRight": "8px"}),
+                        dcc.Dropdown(
+                            id="event-rate-bucket-dropdown",
+                            options=["1m", "5m", "1h"],
+                            value="5m",
+                            clearable=False,
+                            style={"width": "100px", "display": "inline-block"},
+                        ),
+                    ],
+                    style={"marginBottom": "8px"},
+                ),
+                dcc.Graph(id="event-rate-chart"),
+            ],
+            className="chart-container",
+        ),
         html.Hr(),
         html.H2("Average Pull Request Interval (per repository)"),
         html.Div(
@@ -105,24 +148,124 @@ dash_app.layout = html.Div(
 )
 
 
+class ChangeCache:
+    """
+    Counts merged from a `/changes` endpoint, kept in the dashboard process.
+
+    Entries are shared by every browser session asking for the same
+    parameters, so the browser never sends or receives the merged counts and
+    a refresh costs in proportion to the keys that changed, not to the size
+    of the window.
+    """
+
+    def __init__(self, path, top_n=None, max_entries=8):
+        self.path = path
+        self.top_n = top_n
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def refresh(self, params=None):
+        """
+        Merge the changes since the last refresh into the entry for `params`.
+
+        Returns:
+            Dict with the merged `counts`, their `cursor` and, with `top_n`,
+            the `top` (key, count) pairs in descending order
+        """
+        params = dict(params or {})
+        key = tuple(sorted(params.items()))
+        # The lock is shared by every session, so it is never held over HTTP.
+        # Popping the entry gives this refresh sole use of it; a concurrent
+        # refresh of the same parameters starts from a full count instead.
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry:
+            params["cursor"] = entry["cursor"]
+        resp = requests.get(f"{API_BASE}{self.path}", params=params, timeout=10)
+        resp.raise_for_status()
+        data = resp.json()
+        if data["reset"] or not entry:
+            entry = {"counts": {}, "top": []}
+        changes = data["changes"]
+        counts = entry["counts"]
+        for name, delta in changes.items():
+            count = counts.get(name, 0) + delta
+            if count > 0:
+                counts[name] = count
+            else:
+                counts.pop(name, None)
+        entry["cursor"] = data["cursor"]
+        if self.top_n and (data["reset"] or changes):
+            entry["top"] = self._top(entry["top"], counts, changes)
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored and _cursor_order(stored["cursor"]) > _cursor_order(
+                entry["cursor"]
+            ):
+                # A racing refresh got further; keep its counts
+                entry = stored
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _top(self, top, counts, changes):
+        """Re-rank the top keys, rescanning all counts only when one dropped."""
+        if not top or any(changes.get(name, 0) < 0 for name, _ in top):
+            candidates = counts
+        else:
+            # Keys outside the old top that did not grow are still below it
+            candidates = {name: None for name, _ in top}
+            candidates.update(changes)
+        return heapq.nlargest(
+            self.top_n,
+            ((name, counts[name]) for name in candidates if name in counts),
+            key=itemgetter(1),
+        )
+
+
+def _cursor_order(cursor):
+    """Order cursors by (generation, window start); a later one has seen more."""
+    return tuple(int(part) for part in cursor.split(":"))
+
+
+event_type_counts = ChangeCache("/events/count/changes")
+active_repo_counts = ChangeCache("/repositories/active/changes", top_n=10)
+repo_pr_counts = ChangeCache("/repositories/with_multiple_prs/changes")
+
+
 # ---- Event type chart ----
 @dash_app.callback(
     Output("event-type-chart", "figure"),
+    Output("event-type-store", "data"),
     Input("refresh-btn", "n_clicks"),
     State("event-type-offset-input", "value"),
+    State("event-type-store", "data"),
 )
-def update_event_type_chart(n_clicks, offset):
+def update_event_type_chart(n_clicks, offset, drawn):
     if offset is None or offset < 1:
         offset = 1440
     try:
-        resp = requests.get(
-            f"{API_BASE}/events/count", params={"offset": offset}, timeout=10
-        )
-        counts = resp.json()
+        entry = event_type_counts.refresh({"offset": offset})
+        counts = entry["counts"]
+        store = {"offset": offset, "counts": counts}
+        if drawn == store:
+            return no_update, store
+        if drawn and drawn["counts"] and drawn["offset"] == offset and counts:
+            # Patch the existing pie in place instead of rebuilding it
+            fig = Patch()
+            fig["data"][0]["labels"] = list(counts)
+            fig["data"][0]["values"] = list(counts.values())
+            return fig, store
         if not counts:
-            return go.Figure().update_layout(
-                title="No events found in the selected time window",
-                template="plotly_white",
+            return (
+                go.Figure().update_layout(
+                    title="No events found in the selected time window",
+                    template="plotly_white",
+                ),
+                store,
             )
         df = pd.DataFrame([{"type": k, "count": v} for k, v in counts.items()])
         fig = px.pie(
@@ -138,9 +281,57 @@ def update_event_type_chart(n_clicks, offset):
             legend_title="Event Type",
             margin=dict(t=50, b=0, l=0, r=0),
         )
-        return fig
+        return fig, store
     except Exception as e:
         logger.error(f"Error updating event type chart: {e}")
+        return (
+            go.Figure().update_layout(
+                title="Error loading data", template="plotly_white"
+            ),
+            None,
+        )
+
+
+# ---- Event rate chart ----
+@dash_app.callback(
+    Output("event-rate-chart", "figure"),
+    Input("refresh-btn", "n_clicks"),
+    State("event-rate-offset-input", "value"),
+    State("event-rate-bucket-dropdown", "value"),
+)
+def update_event_rate_chart(n_clicks, offset, bucket):
+    if offset is None or offset < 1:
+        offset = 1440
+    try:
+        # The whole series comes from one request, downsampled by the API
+        resp = requests.get(
+            f"{API_BASE}/events/rate",
+            params={"offset": offset, "bucket": bucket or "5m"},
+            timeout=10,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        width = data["bucket_seconds"]
+        fig = go.Figure()
+        for event_type, counts in data["series"].items():
+            fig.add_trace(
+                go.Scatter(
+                    x=data["timestamps"], y=counts, mode="lines", name=event_type
+                )
+            )
+        title = f"Events per {width // 60} minutes (Last {offset} minutes)"
+        if data["downsampled"]:
+            title += " - downsampled"
+        fig.update_layout(
+            title=title,
+            template="plotly_white",
+            xaxis_title="Time (UTC)",
+            yaxis_title="Events",
+            legend_title="Event Type",
+        )
+        return fig
+    except Exception as e:
+        logger.error(f"Error updating event rate chart: {e}")
         return go.Figure().update_layout(
             title="Error loading data", template="plotly_white"
         )
@@ -149,25 +340,35 @@ def update_event_type_chart(n_clicks, offset):
 # ---- Active repos chart ----
 @dash_app.callback(
     Output("active-repos-chart", "figure"),
+    Output("active-repos-store", "data"),
     Input("refresh-btn", "n_clicks"),
     State("active-repos-offset-input", "value"),
+    State("active-repos-store", "data"),
 )
-def update_active_repos_chart(n_clicks, minutes):
+def update_active_repos_chart(n_clicks, minutes, drawn):
     if minutes is None or minutes < 1:
         minutes = 60
     try:
-        resp = requests.get(
-            f"{API_BASE}/repositories/active",
-            params={"limit": 10, "offset": minutes},
-            timeout=10,
-        )
-        repos = resp.json()
-        if not repos:
-            return go.Figure().update_layout(
-                title="No active repositories found in the selected time period",
-                template="plotly_white",
+        top = active_repo_counts.refresh({"offset": minutes})["top"]
+        store = {"offset": minutes, "top": [[repo, cnt] for repo, cnt in top]}
+        if drawn == store:
+            return no_update, store
+        if drawn and drawn["top"] and drawn["offset"] == minutes and top:
+            # Patch the existing bars in place instead of rebuilding the chart
+            fig = Patch()
+            fig["data"][0]["y"] = [repo for repo, _ in top]
+            fig["data"][0]["x"] = [cnt for _, cnt in top]
+            fig["data"][0]["marker"]["color"] = [cnt for _, cnt in top]
+            return fig, store
+        if not top:
+            return (
+                go.Figure().update_layout(
+                    title="No active repositories found in the selected time period",
+                    template="plotly_white",
+                ),
+                store,
             )
-        df = pd.DataFrame(repos)
+        df = pd.DataFrame(top, columns=["repository", "event_count"])
         fig = px.bar(
             df,
             y="repository",
@@ -183,27 +384,40 @@ def update_active_repos_chart(n_clicks, minutes):
             xaxis_title="Event Count",
             margin=dict(t=50, b=0, l=0, r=0),
         )
-        return fig
+        return fig, store
     except Exception as e:
         logger.error(f"Error updating active repos chart: {e}")
-        return go.Figure().update_layout(
-            title="Error loading data", template="plotly_white"
+        return (
+            go.Figure().update_layout(
+                title="Error loading data", template="plotly_white"
+            ),
+            None,
         )
 
 
 # ---- PR Average Interval Visual ----
 @dash_app.callback(
     Output("repo-pr-dropdown", "options"),
+    Output("repo-pr-store", "data"),
     Input("refresh-btn", "n_clicks"),
+    State("repo-pr-store", "data"),
 )
-def update_repo_pr_dropdown(_):
+def update_repo_pr_dropdown(_, drawn):
     try:
-        resp = requests.get(f"{API_BASE}/repositories/with_multiple_prs")
-        repos = resp.json()
-        return [{"label": repo, "value": repo} for repo in repos]
+        entry = repo_pr_counts.refresh()
+        store = {"cursor": entry["cursor"]}
+        if drawn == store:
+            return no_update, store
+        counts = entry["counts"]
+        repos = sorted(
+            (repo for repo, cnt in counts.items() if cnt > 1),
+            key=lambda repo: counts[repo],
+            reverse=True,
+        )
+        return [{"label": repo, "value": repo} for repo in repos], store
     except Exception as e:
         logger.error(f"Error fetching repo list for PR avg: {e}")
-        return []
+        return [], None
 
 
 @dash_app.callback(
@@ -239,16 +453,3 @@ def display_avg_pr_time(n_clicks, repo_name):
 
 if __name__ == "__main__":
     dash_app.run_server(debug=True)
-
-
-def create_dash_app(fastapi_app):
-    """
-    Mounts the Dash app to the given FastAPI app at '/dashboard'.
-    """
-    from starlette.middleware.wsgi import WSGIMiddleware
-
-    if not hasattr(fastapi_app, "mount"):
-        raise ValueError("Argument must be a FastAPI app instance.")
-
-    # Dash app is already constructed globally as `dash_app`
-    fastapi_app.mount("/dashboard", WSGIMiddleware(dash_app.server))
@@ -1,50 +1,142 @@
 from contextlib import asynccontextmanager
+from datetime import datetime
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.wsgi import WSGIMiddleware
 import argparse
 import logging
+import threading
 
-from github_event_monitor.pipeline import DataPipeline
+from github_event_monitor.leader import LeaderLock
+from github_event_monitor.storage import get_storage
 from github_event_monitor.api import router as api_router
-from github_event_monitor.visualization import create_dash_app
 from github_event_monitor import config
 
+# The pipeline (requests), the scheduler and the dashboard (dash, pandas,
+# plotly) are imported only by the processes whose role needs them.
 
 parser = argparse.ArgumentParser(description="GitHub Event Monitor entry point.")
-parser.add_argument(
+role = parser.add_mutually_exclusive_group()
+role.add_argument(
     "--dashboard-only",
     action="store_true",
     help="Run only the dashboard and API (no pipeline/scheduler).",
 )
+role.add_argument(
+    "--api-only",
+    action="store_true",
+    help="Run only the API (no dashboard, pipeline/scheduler). "
+    "Dash and pandas are never imported.",
+)
+parser.add_argument(
+    "--workers",
+    type=int,
+    default=1,
+    help="Number of worker processes serving the API and dashboard. "
+    "Only the elected leader runs the pipeline.",
+)
 args, _ = parser.parse_known_args()
 DASHBOARD_ONLY = args.dashboard_only
+API_ONLY = args.api_only
+RUN_PIPELINE = not (DASHBOARD_ONLY or API_ONLY)
+if args.workers > 1 and not get_storage().multi_process:
+    parser.error(
+        f"The {config.SILVER_BACKEND} silver backend supports a single process only; "
+        "run without --workers."
+    )
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
-pipeline = DataPipeline()
+pipeline = None
+leader = LeaderLock(config.LEADER_LOCK_PATH)
+scheduler = None
+
+
+def run_pipeline_if_leader():
+    """
+    Run the pipeline in the leader process only.
+
+    Every worker schedules this job; followers retry the election on each
+    tick, so another worker takes over if the leader process dies. The
+    pipeline is created by the process that wins the election, which gives
+    the lock back if it cannot initialize the pipeline.
+    """
+    global pipeline
+    if pipeline is None:
+        if not leader.acquire():
+            return
+        from github_event_monitor.pipeline import DataPipeline
+
+        try:
+            candidate = DataPipeline()
+            candidate.initialize()
+        except Exception as e:
+            leader.release()
+            logger.error(f"Error initializing data pipeline: {str(e)}")
+            return
+        pipeline = candidate
+        logger.info("Data pipeline initialized")
+    pipeline.run()
+
+
+class LazyDashboard:
+    """
+    WSGI app that builds the Dash dashboard on its first request.
+
+    Keeps dash, pandas and plotly out of worker startup; the first dashboard
+    request pays for the import instead.
+    """
+
+    def __init__(self):
+        self._server = None
+        self._lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        if self._server is None:
+            with self._lock:
+                if self._server is None:
+                    from github_event_monitor.visualization import dash_app
+
+                    self._server = dash_app.server
+                    logger.info("Dashboard initialized")
+        return self._server(environ, start_response)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global scheduler
     try:
-        if not DASHBOARD_ONLY:
+        if RUN_PIPELINE:
+            from apscheduler.schedulers.background import BackgroundScheduler
+
             if not config.GITHUB_TOKEN:
                 logger.warning(
                     "No GitHub token provided. API rate limits will be restricted. "
                     "Set the GITHUB_TOKEN environment variable to increase rate limits."
                 )
-            pipeline.initialize()
-            logger.info("Data pipeline initialized")
-            pipeline.run()
-            logger.info("Initial data pipeline run completed")
-        else:
+            scheduler = BackgroundScheduler()
+            scheduler.add_job(
+                run_pipeline_if_leader,
+                "interval",
+                seconds=config.COLLECTION_INTERVAL_SECONDS,
+                next_run_time=datetime.now(),
+                max_instances=1,
+                coalesce=True,
+            )
+            scheduler.start()
             logger.info(
-                "Running in DASHBOARD ONLY mode: pipeline/scheduler will not start."
+                f"Pipeline scheduled every {config.COLLECTION_INTERVAL_SECONDS} seconds"
             )
+        else:
+            mode = "API ONLY" if API_ONLY else "DASHBOARD ONLY"
+            logger.info(f"Running in {mode} mode: pipeline/scheduler will not start.")
         yield
     finally:
+        if scheduler is not None and scheduler.running:
+            scheduler.shutdown(wait=False)
+        leader.release()
         logger.info("Application shutdown.")
 
 
@@ -64,9 +156,13 @@ app.add_middleware(
 )
 
 app.include_router(api_router, prefix=config.API_PREFIX)
-create_dash_app(app)
+if not API_ONLY:
+    app.mount(config.DASHBOARD_PREFIX, WSGIMiddleware(LazyDashboard()))
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    if args.workers > 1:
+        uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=args.workers)
+    else:
+        uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,71 @@
+"""
+Shared fixtures.
+
+The package reads its data directory from the environment at import time,
+so it is pointed at a scratch directory before any test imports it.
+"""
+import os
+import tempfile
+
+os.environ["DATA_DIR"] = tempfile.mkdtemp(prefix="gem-tests-")
+os.environ["PAGE_DELAY_SECONDS"] = "0"
+
+import pytest  # noqa: E402
+
+from github_event_monitor import config  # noqa: E402
+from github_event_monitor.storage import get_storage  # noqa: E402
+
+BACKENDS = ["sqlite", "duckdb"]
+
+
+@pytest.fixture(params=BACKENDS)
+def storage(request, tmp_path):
+    """An initialized silver storage backend in a fresh database file."""
+    if request.param == "duckdb":
+        pytest.importorskip("duckdb_engine")
+    storage = get_storage(f"{request.param}:///{tmp_path / 'silver'}.{request.param}")
+    storage.initialize()
+    yield storage
+    storage.engine.dispose()
+    storage.read_engine.dispose()
+
+
+@pytest.fixture
+def bronze_dir(tmp_path, monkeypatch):
+    """Point the bronze layer at a fresh directory."""
+    path = tmp_path / "bronze"
+    path.mkdir()
+    monkeypatch.setattr(config, "BRONZE_DIR", path)
+    return path
+
+
+@pytest.fixture
+def api_client(storage, monkeypatch):
+    """A client for the API router, reading from the `storage` fixture."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from github_event_monitor import api
+
+    monkeypatch.setattr(api, "storage", storage)
+    monkeypatch.setattr(api, "engine", storage.read_engine)
+    app = FastAPI()
+    app.include_router(api.router, prefix=config.API_PREFIX)
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Pin the API's notion of "now" for windowed endpoints; advance with `.now`."""
+    from datetime import datetime, timedelta, timezone
+
+    from github_event_monitor import api
+
+    class Clock:
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+
+    monkeypatch.setattr(
+        api, "_window_start", lambda offset: Clock.now - timedelta(minutes=offset)
+    )
+    return Clock
@@ -0,0 +1,58 @@
+"""
+Test data factories.
+"""
+from datetime import datetime, timedelta, timezone
+
+from github_event_monitor.database import get_sync_session
+
+# A fixed reference time for tests that need exact timestamps
+BASE = datetime(2024, 3, 1, 12, 0, tzinfo=timezone.utc)
+# Timezones a query bound may be given in (None for a naive timestamp)
+ZONES = [
+    None,
+    timezone.utc,
+    timezone(timedelta(hours=2)),
+    timezone(timedelta(hours=-5)),
+]
+ZONE_IDS = ["naive", "utc", "+02:00", "-05:00"]
+
+
+def silver_event(
+    event_id,
+    event_type="WatchEvent",
+    repo_id=1,
+    repo="owner/repo",
+    actor_id=10,
+    actor="user",
+    created_at=None,
+):
+    """A transformed silver event row, as produced by the silver layer."""
+    return {
+        "id": event_id,
+        "type": event_type,
+        "actor": actor,
+        "actor_id": actor_id,
+        "repo": repo,
+        "repo_id": repo_id,
+        "public": True,
+        "created_at": created_at or datetime.now(timezone.utc) - timedelta(minutes=1),
+        "payload": {},
+    }
+
+
+def load_batch(storage, events):
+    """Insert events as one silver load batch (one generation)."""
+    with get_sync_session(storage.engine) as session:
+        generation = storage.next_generation(session)
+        for event in events:
+            event["generation"] = generation
+        inserted = storage.insert_new_events(session, events)
+        session.commit()
+    return inserted
+
+
+def bound(value, zone):
+    """Format a UTC datetime as a query parameter in `zone` (naive when None)."""
+    if zone is None:
+        return value.replace(tzinfo=None).isoformat()
+    return value.astimezone(zone).isoformat()
@@ -0,0 +1,93 @@
+"""
+Tests for the cursor based `/changes` endpoints: merging every delta into
+the counts a client already holds must give the same result as a fresh
+full count.
+"""
+import random
+from datetime import timedelta
+
+import pytest
+
+from tests.factories import load_batch, silver_event
+
+WINDOWED = ["/api/events/count/changes", "/api/repositories/active/changes"]
+
+
+def merge(counts, result):
+    counts = {} if result["reset"] else dict(counts)
+    for key, delta in result["changes"].items():
+        count = counts.get(key, 0) + delta
+        if count:
+            counts[key] = count
+        else:
+            counts.pop(key)
+    return counts
+
+
+def random_events(rng, clock, first_id, count):
+    return [
+        silver_event(
+            first_id + i,
+            event_type=rng.choice(["WatchEvent", "PullRequestEvent", "IssuesEvent"]),
+            repo_id=(repo_id := rng.randint(1, 12)),
+            repo=f"owner/repo-{repo_id}",
+            created_at=clock.now - timedelta(minutes=rng.uniform(0, 180)),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("path", WINDOWED)
+def test_deltas_follow_loads_and_window_slides(storage, api_client, clock, path):
+    rng = random.Random(3)
+    counts, cursor, next_id = {}, None, 1
+    # (clock advance in minutes, window offset in minutes, events loaded)
+    steps = [(0, 60, 50), (0, 60, 30), (10, 60, 0), (5, 60, 40), (0, 120, 0)]
+    steps += [(0, 30, 20), (20, 90, 25), (0, 90, 0), (30, 45, 10)]
+    for advance, offset, loaded in steps:
+        if loaded:
+            load_batch(storage, random_events(rng, clock, next_id, loaded))
+            next_id += loaded
+        clock.now += timedelta(minutes=advance)
+
+        params = {"offset": offset, **({"cursor": cursor} if cursor else {})}
+        result = api_client.get(path, params=params)
+        assert result.status_code == 200
+        result = result.json()
+        assert result["reset"] is (cursor is None)
+        counts, cursor = merge(counts, result), result["cursor"]
+
+        fresh = api_client.get(path, params={"offset": offset}).json()
+        assert fresh["reset"]
+        assert counts == fresh["changes"]
+
+
+def test_unchanged_window_returns_no_changes(storage, api_client, clock):
+    load_batch(storage, random_events(random.Random(1), clock, 1, 30))
+    first = api_client.get("/api/events/count/changes", params={"offset": 60}).json()
+    again = api_client.get(
+        "/api/events/count/changes", params={"offset": 60, "cursor": first["cursor"]}
+    ).json()
+    assert again == {"cursor": first["cursor"], "reset": False, "changes": {}}
+
+
+def test_pr_count_deltas_follow_loads(storage, api_client, clock):
+    rng = random.Random(5)
+    counts, cursor, next_id = {}, None, 1
+    for loaded in (40, 0, 25, 60):
+        if loaded:
+            load_batch(storage, random_events(rng, clock, next_id, loaded))
+            next_id += loaded
+        params = {"cursor": cursor} if cursor else {}
+        result = api_client.get(
+            "/api/repositories/with_multiple_prs/changes", params=params
+        ).json()
+        counts, cursor = merge(counts, result), result["cursor"]
+
+        fresh = api_client.get("/api/repositories/with_multiple_prs/changes").json()
+        assert counts == fresh["changes"]
+
+
+def test_invalid_cursor_is_rejected(storage, api_client):
+    response = api_client.get("/api/events/count/changes", params={"cursor": "abc"})
+    assert response.status_code == 400
@@ -0,0 +1,29 @@
+"""
+Tests for `/events/export`: time bounds in any timezone select the same
+events as the equivalent UTC range.
+"""
+import json
+from datetime import timedelta
+
+import pytest
+
+from tests.factories import BASE, ZONE_IDS, ZONES, bound, load_batch, silver_event
+
+
+@pytest.mark.parametrize("zone", ZONES, ids=ZONE_IDS)
+def test_export_bounds_are_converted_to_utc(storage, api_client, zone):
+    created = [BASE + timedelta(minutes=17 * i) for i in range(60)]
+    load_batch(
+        storage, [silver_event(i + 1, created_at=at) for i, at in enumerate(created)]
+    )
+    start, end = BASE + timedelta(hours=3), BASE + timedelta(hours=9, minutes=30)
+
+    response = api_client.get(
+        "/api/events/export",
+        params={"start": bound(start, zone), "end": bound(end, zone)},
+    )
+    assert response.status_code == 200
+    exported = [json.loads(line)["id"] for line in response.text.splitlines()]
+
+    expected = [str(i + 1) for i, at in enumerate(created) if start <= at < end]
+    assert expected and exported == expected
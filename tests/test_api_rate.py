@@ -0,0 +1,77 @@
+"""
+Tests for `/events/rate`: the bucketed series must match a brute-force count
+of the stored events, whatever timezone the range is given in.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tests.factories import BASE, ZONE_IDS, ZONES, bound, load_batch, silver_event
+
+TYPES = ["WatchEvent", "IssuesEvent", "PullRequestEvent"]
+
+
+def brute_force(events, start, end, width):
+    """Count events per type and epoch bucket, in plain Python."""
+    first = int(start.timestamp()) // width
+    last = (int(end.timestamp()) - 1) // width
+    series = {event_type: [0] * (last - first + 1) for event_type in TYPES}
+    for event in events:
+        if start <= event["created_at"] < end:
+            number = int(event["created_at"].timestamp()) // width
+            series[event["type"]][number - first] += 1
+    return series
+
+
+@pytest.fixture
+def events(storage):
+    rng = random.Random(7)
+    events = [
+        silver_event(
+            i + 1,
+            event_type=rng.choice(TYPES),
+            created_at=BASE + timedelta(seconds=rng.randint(0, 12 * 3600)),
+        )
+        for i in range(400)
+    ]
+    # Rows exactly on bucket and range boundaries
+    for i, minutes in enumerate((60, 65, 180, 390)):
+        at = BASE + timedelta(minutes=minutes)
+        events.append(silver_event(1000 + i, event_type="WatchEvent", created_at=at))
+    load_batch(storage, events)
+    return events
+
+
+@pytest.mark.parametrize("zone", ZONES, ids=ZONE_IDS)
+@pytest.mark.parametrize("bucket, max_points", [("5m", 1000), ("1m", 100)])
+def test_rate_matches_brute_force_count(
+    storage, api_client, events, zone, bucket, max_points
+):
+    start = BASE + timedelta(hours=1)
+    end = BASE + timedelta(hours=6, minutes=30)
+    response = api_client.get(
+        "/api/events/rate",
+        params=[
+            ("start", bound(start, zone)),
+            ("end", bound(end, zone)),
+            ("bucket", bucket),
+            ("max_points", max_points),
+        ],
+    )
+    assert response.status_code == 200
+    result = response.json()
+
+    width = result["bucket_seconds"]
+    assert result["downsampled"] is (max_points == 100)
+    expected = brute_force(events, start, end, width)
+    assert {t: result["series"][t] for t in TYPES} == expected
+    assert not any(
+        any(counts) for t, counts in result["series"].items() if t not in TYPES
+    )
+    first = int(start.timestamp()) // width
+    assert (
+        result["timestamps"][0]
+        == datetime.fromtimestamp(first * width, timezone.utc).isoformat()
+    )
+    assert len(result["timestamps"]) == len(expected["WatchEvent"])
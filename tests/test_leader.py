@@ -0,0 +1,83 @@
+"""
+Tests for the pipeline leader election between worker processes.
+"""
+import pytest
+
+import main
+from github_event_monitor import pipeline as pipeline_module
+from github_event_monitor.leader import LeaderLock
+
+
+class FakePipeline:
+    fail_initialize = False
+    runs = 0
+
+    def initialize(self):
+        if FakePipeline.fail_initialize:
+            raise RuntimeError("database is locked")
+
+    def run(self):
+        FakePipeline.runs += 1
+
+
+@pytest.fixture
+def lock_path(tmp_path):
+    return tmp_path / "leader.lock"
+
+
+@pytest.fixture
+def worker(lock_path, monkeypatch):
+    """The `main` module as a worker competing for the lock at `lock_path`."""
+    monkeypatch.setattr(main, "leader", LeaderLock(lock_path))
+    monkeypatch.setattr(main, "pipeline", None)
+    monkeypatch.setattr(pipeline_module, "DataPipeline", FakePipeline)
+    monkeypatch.setattr(FakePipeline, "fail_initialize", False)
+    monkeypatch.setattr(FakePipeline, "runs", 0)
+    yield main
+    main.leader.release()
+
+
+def test_lock_is_exclusive_until_released(lock_path):
+    first, second = LeaderLock(lock_path), LeaderLock(lock_path)
+    assert first.acquire()
+    assert not second.acquire()
+    assert not second.is_leader
+
+    first.release()
+    assert second.acquire()
+    assert not first.acquire()
+    second.release()
+
+
+def test_pipeline_runs_only_in_the_lock_holder(worker, lock_path):
+    other = LeaderLock(lock_path)
+    assert other.acquire()
+    worker.run_pipeline_if_leader()
+    assert worker.pipeline is None
+    assert FakePipeline.runs == 0
+
+    # The other worker died: this one takes over on its next tick
+    other.release()
+    worker.run_pipeline_if_leader()
+    worker.run_pipeline_if_leader()
+    assert worker.leader.is_leader
+    assert FakePipeline.runs == 2
+    assert not other.acquire()
+
+
+def test_failed_initialization_gives_up_the_lock(worker, lock_path):
+    FakePipeline.fail_initialize = True
+    worker.run_pipeline_if_leader()
+    assert worker.pipeline is None
+    assert not worker.leader.is_leader
+
+    # Another worker can take over
+    other = LeaderLock(lock_path)
+    assert other.acquire()
+    other.release()
+
+    # This worker retries on its next tick
+    FakePipeline.fail_initialize = False
+    worker.run_pipeline_if_leader()
+    assert worker.leader.is_leader
+    assert FakePipeline.runs == 1
@@ -0,0 +1,156 @@
+"""
+Tests for the bronze manifest as used by the pipeline: files are loaded
+exactly once across crashes, unreadable files are given up on, and
+ingestion stops at events it has already fetched.
+"""
+import json
+import os
+
+import pytest
+from sqlalchemy import func, select
+
+from benchmarks.generator import SyntheticEventGenerator
+from benchmarks.stub_server import GitHubEventsStub
+from github_event_monitor import config
+from github_event_monitor.database import get_sync_session
+from github_event_monitor.medallion.manifest import FAILED, FETCHED, LOADED
+from github_event_monitor.models import BronzeFile, Event
+from github_event_monitor.pipeline import DataPipeline
+
+PER_PAGE = 10
+
+
+@pytest.fixture
+def stub(storage, bronze_dir, monkeypatch):
+    """A GitHub events stub that new pipelines fetch from and load into `storage`."""
+    monkeypatch.setattr(config, "SILVER_DB_URL", storage.database_url)
+    monkeypatch.setattr(config, "PER_PAGE", PER_PAGE)
+    monkeypatch.setattr(config, "MAX_PAGES_PER_COLLECTION", 10)
+    with GitHubEventsStub() as stub:
+        monkeypatch.setattr(config, "GITHUB_API_URL", stub.url)
+        yield stub
+
+
+@pytest.fixture
+def generator():
+    return SyntheticEventGenerator(
+        repo_count=20, actor_count=20, body_size=10, event_types=["WatchEvent"]
+    )
+
+
+def count_events(storage):
+    with get_sync_session(storage.engine) as session:
+        return session.execute(select(func.count()).select_from(Event)).scalar()
+
+
+def file_states(storage):
+    with get_sync_session(storage.engine) as session:
+        return (
+            session.execute(select(BronzeFile.state).order_by(BronzeFile.name))
+            .scalars()
+            .all()
+        )
+
+
+def test_file_fetched_before_a_crash_is_loaded_once(storage, stub, generator):
+    stub.publish(generator.generate(15))
+    # Crash between recording the files and loading them
+    files = DataPipeline().bronze.ingest_events()
+    assert len(files) == 2
+    assert file_states(storage) == [FETCHED, FETCHED]
+    assert count_events(storage) == 0
+
+    # The restarted pipeline finds nothing new upstream but resumes the files
+    DataPipeline().run()
+    assert count_events(storage) == 15
+    assert file_states(storage) == [LOADED, LOADED]
+    with get_sync_session(storage.engine) as session:
+        assert storage.next_generation(session) == 3
+
+    DataPipeline().run()
+    with get_sync_session(storage.engine) as session:
+        assert storage.next_generation(session) == 3
+
+
+def test_file_recorded_before_a_crash_is_loaded_once(
+    storage, stub, generator, monkeypatch
+):
+    stub.publish(generator.generate(5))
+
+    def crash(src, dst):
+        raise RuntimeError("crashed before the rename")
+
+    # Crash between recording the file and renaming it into place
+    with monkeypatch.context() as m:
+        m.setattr(os, "replace", crash)
+        assert DataPipeline().bronze.ingest_events() == []
+    assert file_states(storage) == [FETCHED]
+    assert [path.suffix for path in config.BRONZE_DIR.iterdir()] == [".tmp"]
+
+    DataPipeline().run()
+    assert count_events(storage) == 5
+    assert file_states(storage) == [LOADED]
+    assert [path.suffix for path in config.BRONZE_DIR.iterdir()] == [".json"]
+
+
+def test_missing_file_is_refetched(storage, stub, generator):
+    stub.publish(generator.generate(5))
+    [path] = DataPipeline().bronze.ingest_events()
+    path.unlink()
+
+    # The row is dropped, which moves the checkpoint back for the next run
+    DataPipeline().run()
+    assert file_states(storage) == []
+    DataPipeline().run()
+    assert count_events(storage) == 5
+    assert file_states(storage) == [LOADED]
+
+
+def test_crash_during_load_leaves_file_pending(storage, stub, generator, monkeypatch):
+    stub.publish(generator.generate(5))
+    pipeline = DataPipeline()
+
+    def crash(session, file_path):
+        raise RuntimeError("crashed before commit")
+
+    monkeypatch.setattr(pipeline.manifest, "mark_loaded", crash)
+    pipeline.run()
+    assert count_events(storage) == 0
+    assert file_states(storage) == [FETCHED]
+
+    DataPipeline().run()
+    assert count_events(storage) == 5
+    assert file_states(storage) == [LOADED]
+
+
+def test_unreadable_file_is_marked_failed(storage, stub, generator):
+    stub.publish(generator.generate(5))
+    pipeline = DataPipeline()
+    [path] = pipeline.bronze.ingest_events()
+    path.write_text('[{"id": "1", "type": ')
+
+    pipeline.run()
+    assert file_states(storage) == [FAILED]
+    assert pipeline.manifest.pending_files() == []
+    assert count_events(storage) == 0
+
+
+def test_ingestion_stops_at_checkpoint(storage, stub, generator):
+    stub.publish(generator.generate(3 * PER_PAGE))
+    bronze = DataPipeline().bronze
+    assert len(bronze.ingest_events()) == 3
+    served = stub.requests_served
+
+    # Five new events: the first page mixes new and seen events, the second
+    # page is entirely at or below the checkpoint and ends the collection
+    new_events = generator.generate(5)
+    stub.publish(new_events)
+    [path] = bronze.ingest_events()
+    assert stub.requests_served - served == 2
+    page = json.loads(path.read_text())
+    assert {event["id"] for event in new_events} <= {event["id"] for event in page}
+
+    # Nothing new: the first page already stops the collection
+    served = stub.requests_served
+    assert bronze.ingest_events() == []
+    assert stub.requests_served - served == 1
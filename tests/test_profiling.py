@@ -0,0 +1,107 @@
+"""
+Tests for the opt-in profiler: armed counts, the admin endpoints and
+arming the pipeline leader from another worker.
+"""
+import logging
+import threading
+import time
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from github_event_monitor import api, config, profiling
+from github_event_monitor.profiling import API, PIPELINE, Profiler
+from tests.factories import load_batch, silver_event
+
+TOKEN = "secret"
+
+
+@pytest.fixture
+def profiler(tmp_path, monkeypatch):
+    """A fresh profiler writing to a scratch directory, used by the API."""
+    monkeypatch.setattr(config, "PROFILE_DIR", tmp_path / "profiles")
+    monkeypatch.setattr(config, "PROFILE_API_REQUESTS", 0)
+    monkeypatch.setattr(config, "PROFILE_PIPELINE_RUNS", 0)
+    profiler = Profiler()
+    monkeypatch.setattr(profiling, "profiler", profiler)
+    monkeypatch.setattr(api, "profiler", profiler)
+    yield profiler
+    for name, listener in [
+        ("before_cursor_execute", profiler._before_execute),
+        ("after_cursor_execute", profiler._after_execute),
+    ]:
+        while event.contains(Engine, name, listener):
+            event.remove(Engine, name, listener)
+
+
+def test_armed_api_count_profiles_exactly_n_requests(
+    storage, api_client, profiler, caplog
+):
+    load_batch(storage, [silver_event(1)])
+    profiler.arm(API, 2)
+    with caplog.at_level(logging.INFO, logger=profiling.__name__):
+        for _ in range(3):
+            assert api_client.get("/api/events/count").status_code == 200
+
+    profiles = profiler.profiles()
+    assert len(profiles) == 2
+    assert all(path.name.startswith("api_events_count_") for path in profiles)
+    assert profiler.remaining(API) == 0
+    sql = [r.message for r in caplog.records if r.message.startswith("SQL ")]
+    assert len(sql) == 2
+    assert all("FROM events" in message for message in sql)
+
+
+def test_admin_endpoints_require_the_token(api_client, profiler, monkeypatch):
+    monkeypatch.setattr(config, "ADMIN_TOKEN", "")
+    assert api_client.get("/api/admin/profile").status_code == 404
+
+    monkeypatch.setattr(config, "ADMIN_TOKEN", TOKEN)
+    assert api_client.get("/api/admin/profile").status_code == 403
+    response = api_client.get("/api/admin/profile", headers={"X-Admin-Token": "wrong"})
+    assert response.status_code == 403
+    response = api_client.post(
+        "/api/admin/profile",
+        params={"target": API, "count": 3},
+        headers={"X-Admin-Token": TOKEN},
+    )
+    assert response.status_code == 200
+    assert response.json()["remaining"][API] == 3
+
+
+def test_pipeline_armed_in_one_worker_is_taken_in_another(profiler):
+    worker, leader = profiler, Profiler()
+    assert worker.remaining(PIPELINE) == 0
+    worker.arm(PIPELINE, 2)
+
+    assert leader._take(PIPELINE)
+    assert worker.remaining(PIPELINE) == 1
+    assert leader._take(PIPELINE)
+    assert not leader._take(PIPELINE)
+    assert worker.remaining(PIPELINE) == 0
+    assert leader.remaining(PIPELINE) == 0
+
+
+def test_sql_listeners_are_registered_once(profiler, monkeypatch):
+    registered = []
+    listen = event.listen
+
+    def slow_listen(*args):
+        registered.append(args[1])
+        time.sleep(0.01)
+        listen(*args)
+
+    monkeypatch.setattr(profiling.event, "listen", slow_listen)
+    barrier = threading.Barrier(8)
+
+    def first_capture():
+        barrier.wait()
+        profiler._listen_to_sql()
+
+    threads = [threading.Thread(target=first_capture) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert registered == ["before_cursor_execute", "after_cursor_execute"]
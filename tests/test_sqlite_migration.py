@@ -0,0 +1,78 @@
+"""
+Tests for upgrading silver SQLite databases created by earlier versions.
+"""
+import sqlite3
+
+from sqlalchemy import inspect, select
+
+from github_event_monitor.database import get_sync_session
+from github_event_monitor.models import Actor, Event, Repository
+from github_event_monitor.storage import get_storage
+from tests.factories import silver_event
+
+LEGACY_SCHEMA = """
+CREATE TABLE events (
+    id VARCHAR NOT NULL PRIMARY KEY,
+    type VARCHAR,
+    actor VARCHAR,
+    actor_id INTEGER,
+    repo VARCHAR,
+    repo_id INTEGER,
+    public BOOLEAN,
+    created_at DATETIME,
+    payload JSON
+);
+CREATE INDEX ix_events_id ON events (id);
+CREATE INDEX ix_events_type ON events (type);
+CREATE INDEX ix_events_repo ON events (repo);
+CREATE INDEX ix_events_actor ON events (actor);
+CREATE INDEX ix_events_created_at ON events (created_at);
+"""
+
+
+def test_legacy_database_is_upgraded(tmp_path):
+    path = tmp_path / "legacy.db"
+    with sqlite3.connect(path) as conn:
+        conn.executescript(LEGACY_SCHEMA)
+        conn.executemany(
+            "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, 1, ?, '{}')",
+            [
+                # Renamed repository: the newest name must win, not the largest
+                ("101", "WatchEvent", "zed", 5, "zzz/old", 1, "2024-01-01 10:00:00"),
+                ("102", "WatchEvent", "amy", 5, "aaa/new", 1, "2024-01-02 10:00:00"),
+                ("103", "IssuesEvent", "bob", 6, "bbb/repo", 2, "2024-01-01 12:00:00"),
+            ],
+        )
+
+    storage = get_storage(f"sqlite:///{path}")
+    storage.initialize()
+    with get_sync_session(storage.engine) as session:
+        repos = session.execute(select(Repository.id, Repository.name)).all()
+        actors = session.execute(select(Actor.id, Actor.login)).all()
+        events = session.execute(
+            select(Event.id, Event.type, Event.repo_id, Event.generation).order_by(
+                Event.id
+            )
+        ).all()
+        columns = {
+            c["name"] for c in inspect(session.connection()).get_columns("events")
+        }
+
+    assert sorted(repos) == [(1, "aaa/new"), (2, "bbb/repo")]
+    assert sorted(actors) == [(5, "amy"), (6, "bob")]
+    assert events == [
+        (101, "WatchEvent", 1, 0),
+        (102, "WatchEvent", 1, 0),
+        (103, "IssuesEvent", 2, 0),
+    ]
+    assert "repo" not in columns and "actor" not in columns
+
+    # Loads keep working on the rebuilt table, and upgrading again is a no-op
+    with get_sync_session(storage.engine) as session:
+        assert (
+            storage.insert_new_events(session, [silver_event(103), silver_event(104)])
+            == 1
+        )
+        session.commit()
+    storage.initialize()
+    storage.engine.dispose()
@@ -0,0 +1,108 @@
+"""
+Tests for the silver storage backends, run against every backend.
+"""
+from pathlib import Path
+
+from sqlalchemy import func, select
+
+from github_event_monitor.database import get_sync_session
+from github_event_monitor.medallion.manifest import FETCHED, BronzeManifest
+from github_event_monitor.models import Actor, BronzeFile, Event, Repository
+from tests.factories import silver_event
+
+
+def insert(storage, events):
+    with get_sync_session(storage.engine) as session:
+        inserted = storage.insert_new_events(session, events)
+        session.commit()
+    return inserted
+
+
+def fetch_all(storage, *columns):
+    with get_sync_session(storage.engine) as session:
+        return session.execute(select(*columns).order_by(columns[0])).all()
+
+
+def test_insert_new_events_skips_stored_ids(storage):
+    assert insert(storage, [silver_event(i) for i in (1, 2, 3)]) == 3
+    # Overlapping batch: only the unseen ID is inserted
+    assert insert(storage, [silver_event(i) for i in (2, 3, 4)]) == 1
+    assert insert(storage, [silver_event(i) for i in (1, 4)]) == 0
+
+    assert [row.id for row in fetch_all(storage, Event.id)] == [1, 2, 3, 4]
+
+
+def test_insert_new_events_keeps_last_duplicate_in_batch(storage):
+    batch = [
+        silver_event(1, event_type="WatchEvent"),
+        silver_event(1, event_type="IssuesEvent"),
+    ]
+    assert insert(storage, batch) == 1
+    assert fetch_all(storage, Event.id, Event.type) == [(1, "IssuesEvent")]
+
+
+def test_insert_new_events_does_not_touch_stored_rows(storage):
+    with get_sync_session(storage.engine) as session:
+        event = silver_event(1, event_type="WatchEvent")
+        event["generation"] = 1
+        storage.insert_new_events(session, [event])
+        session.commit()
+    replay = silver_event(1, event_type="IssuesEvent")
+    replay["generation"] = 2
+    assert insert(storage, [replay]) == 0
+    assert fetch_all(storage, Event.type, Event.generation) == [("WatchEvent", 1)]
+
+
+def test_dimensions_follow_renames(storage):
+    insert(storage, [silver_event(1, repo_id=7, repo="old/name", actor="before")])
+    insert(storage, [silver_event(2, repo_id=7, repo="new/name", actor="after")])
+    # Renaming back must not be skipped by the name cache
+    insert(storage, [silver_event(3, repo_id=8, repo="old/name")])
+
+    assert fetch_all(storage, Repository.id, Repository.name) == [
+        (7, "new/name"),
+        (8, "old/name"),
+    ]
+    assert fetch_all(storage, Actor.id, Actor.login) == [(10, "user")]
+
+
+def test_dimension_cache_ignores_rolled_back_writes(storage):
+    with get_sync_session(storage.engine) as session:
+        storage.insert_new_events(session, [silver_event(1, repo_id=7)])
+        session.rollback()
+    insert(storage, [silver_event(2, repo_id=7)])
+
+    assert fetch_all(storage, Repository.id, Repository.name) == [(7, "owner/repo")]
+
+
+def test_manifest_upsert_overwrites_by_name(storage, bronze_dir):
+    manifest = BronzeManifest(storage)
+    path = Path(bronze_dir) / "github_events_1.json"
+    manifest.record_fetched(path, [{"id": "5"}, {"id": "9"}])
+    with get_sync_session(storage.engine) as session:
+        manifest.mark_loaded(session, path)
+        session.commit()
+    manifest.record_fetched(path, [{"id": "12"}])
+
+    rows = fetch_all(
+        storage,
+        BronzeFile.name,
+        BronzeFile.state,
+        BronzeFile.event_count,
+        BronzeFile.min_event_id,
+        BronzeFile.max_event_id,
+    )
+    assert rows == [(path.name, FETCHED, 1, 12, 12)]
+    assert manifest.checkpoint() == 12
+
+
+def test_next_generation_increments(storage):
+    with get_sync_session(storage.engine) as session:
+        assert storage.next_generation(session) == 1
+        event = silver_event(1)
+        event["generation"] = 1
+        storage.insert_new_events(session, [event])
+        session.commit()
+        assert storage.next_generation(session) == 2
+        count = session.execute(select(func.count()).select_from(Event)).scalar()
+    assert count == 1
@@ -0,0 +1,127 @@
+"""
+Tests for the dashboard's server-side change cache.
+"""
+import heapq
+import random
+import threading
+from datetime import timedelta
+from operator import itemgetter
+
+import pytest
+
+from github_event_monitor import visualization
+from tests.factories import load_batch, silver_event
+
+
+@pytest.fixture
+def routed(api_client, monkeypatch):
+    """Send the dashboard's API requests to the test client."""
+
+    def get(url, params=None, timeout=None):
+        path = url[len(visualization.API_BASE) :]
+        return api_client.get(f"/api{path}", params=params)
+
+    monkeypatch.setattr(visualization.requests, "get", get)
+    return api_client
+
+
+def random_events(rng, clock, first_id, count):
+    return [
+        silver_event(
+            first_id + i,
+            repo_id=(repo_id := rng.randint(1, 30)),
+            repo=f"owner/repo-{repo_id}",
+            created_at=clock.now - timedelta(minutes=rng.uniform(0, 120)),
+        )
+        for i in range(count)
+    ]
+
+
+def test_active_repo_top_follows_full_ranking(storage, routed, clock):
+    rng = random.Random(7)
+    cache = visualization.ChangeCache("/repositories/active/changes", top_n=5)
+    next_id = 1
+    for step in range(6):
+        load_batch(storage, random_events(rng, clock, next_id, 40))
+        next_id += 40
+        # Slide the window forward so some repositories lose events
+        clock.now += timedelta(minutes=15 * (step % 2))
+        entry = cache.refresh({"offset": 60})
+
+        fresh = routed.get("/api/repositories/active/changes", params={"offset": 60})
+        counts = fresh.json()["changes"]
+        assert entry["counts"] == counts
+        expected = heapq.nlargest(5, counts.items(), key=itemgetter(1))
+        assert [cnt for _, cnt in entry["top"]] == [cnt for _, cnt in expected]
+        assert all(counts[repo] == cnt for repo, cnt in entry["top"])
+
+
+def test_entries_are_kept_per_parameters(storage, routed, clock):
+    load_batch(
+        storage,
+        [
+            silver_event(1, created_at=clock.now - timedelta(minutes=5)),
+            silver_event(2, created_at=clock.now - timedelta(minutes=50)),
+        ],
+    )
+    cache = visualization.ChangeCache("/events/count/changes", max_entries=1)
+    assert cache.refresh({"offset": 10})["counts"] == {"WatchEvent": 1}
+    assert cache.refresh({"offset": 60})["counts"] == {"WatchEvent": 2}
+    assert len(cache._entries) == 1
+
+
+def test_slow_refresh_does_not_block_other_parameters(
+    storage, routed, clock, monkeypatch
+):
+    load_batch(storage, [silver_event(1, created_at=clock.now)])
+    cache = visualization.ChangeCache("/events/count/changes")
+    answered, release = threading.Event(), threading.Event()
+    get = visualization.requests.get
+
+    def slow_get(url, params=None, timeout=None):
+        response = get(url, params=params, timeout=timeout)
+        if params["offset"] == 60:
+            answered.set()
+            release.wait(10)
+        return response
+
+    monkeypatch.setattr(visualization.requests, "get", slow_get)
+    slow = threading.Thread(target=cache.refresh, args=({"offset": 60},))
+    slow.start()
+    try:
+        assert answered.wait(10)
+        assert cache.refresh({"offset": 10})["counts"] == {"WatchEvent": 1}
+        # Answered while the other refresh is still waiting on its response
+        assert slow.is_alive()
+    finally:
+        release.set()
+        slow.join()
+
+
+def test_racing_refreshes_keep_the_newer_cursor(storage, routed, clock, monkeypatch):
+    load_batch(storage, [silver_event(1, created_at=clock.now)])
+    cache = visualization.ChangeCache("/events/count/changes")
+    cache.refresh({"offset": 60})
+    answered, release = threading.Event(), threading.Event()
+    get = visualization.requests.get
+
+    def stale_get(url, params=None, timeout=None):
+        response = get(url, params=params, timeout=timeout)
+        if threading.current_thread() is not threading.main_thread():
+            answered.set()
+            release.wait(10)
+        return response
+
+    monkeypatch.setattr(visualization.requests, "get", stale_get)
+    stale = threading.Thread(target=cache.refresh, args=({"offset": 60},))
+    stale.start()
+    assert answered.wait(10)
+    # Loaded after the stale refresh was answered; this refresh starts over
+    load_batch(storage, [silver_event(2, created_at=clock.now)])
+    assert cache.refresh({"offset": 60})["counts"] == {"WatchEvent": 2}
+    release.set()
+    stale.join()
+
+    [entry] = cache._entries.values()
+    assert entry["counts"] == {"WatchEvent": 2}
+    assert cache.refresh({"offset": 60})["counts"] == {"WatchEvent": 2}